@@ -1,11 +1,60 @@
 import json
 import warnings
 from dataclasses import dataclass
+from functools import lru_cache
 
 def get_str_attr(obj, attr, default=""):
     """Get string attribute with fallback and strip whitespace."""
     return (getattr(obj, attr, default) or default).strip()
 
+# Common named keys - always use the base (unshifted) key name
+_NAMED_KEYS = {
+    "SPACE": "space",
+    "TAB": "tab",
+    "RET": "enter",
+    "ESC": "esc",
+    "BACK_SPACE": "backspace",
+    # Number keys (main row)
+    "ZERO": "0", "ONE": "1", "TWO": "2", "THREE": "3", "FOUR": "4",
+    "FIVE": "5", "SIX": "6", "SEVEN": "7", "EIGHT": "8", "NINE": "9",
+    # Numpad keys
+    "NUMPAD_0": "n0", "NUMPAD_1": "n1", "NUMPAD_2": "n2", "NUMPAD_3": "n3",
+    "NUMPAD_4": "n4", "NUMPAD_5": "n5", "NUMPAD_6": "n6", "NUMPAD_7": "n7",
+    "NUMPAD_8": "n8", "NUMPAD_9": "n9",
+    # Common punctuation
+    "MINUS": "-", "EQUAL": "=",
+    "LEFT_BRACKET": "[", "RIGHT_BRACKET": "]",
+    "SEMI_COLON": ";", "QUOTE": "'",
+    "COMMA": ",", "PERIOD": ".",
+    "SLASH": "/", "BACK_SLASH": "\\",
+    "GRAVE_ACCENT": "grave", "ACCENT_GRAVE": "grave",
+    "NUM_LOCK": "numlock", "CAPS_LOCK": "capslock",
+    # Arrows
+    "UP_ARROW": "up", "DOWN_ARROW": "down",
+    "LEFT_ARROW": "left", "RIGHT_ARROW": "right",
+    # Navigation
+    "PAGE_UP": "pageup", "PAGE_DOWN": "pagedown",
+    "HOME": "home", "END": "end",
+    "INSERT": "insert", "DEL": "delete",
+    # Function keys F1 - F24
+    "F1": "f1", "F2": "f2", "F3": "f3", "F4": "f4", "F5": "f5", "F6": "f6",
+    "F7": "f7", "F8": "f8", "F9": "f9", "F10": "f10", "F11": "f11", "F12": "f12",
+    "F13": "f13", "F14": "f14", "F15": "f15", "F16": "f16", "F17": "f17", "F18": "f18",
+    "F19": "f19", "F20": "f20", "F21": "f21", "F22": "f22", "F23": "f23", "F24": "f24",
+    # Numpad Operators
+    "NUMPAD_SLASH": "n/", "NUMPAD_ASTERISK": "n*",
+    "NUMPAD_MINUS": "n-", "NUMPAD_PLUS": "n+",
+    "NUMPAD_ENTER": "nenter", "NUMPAD_PERIOD": "n.",
+    # Mouse buttons 1-7
+    "LEFTMOUSE": "m1", "RIGHTMOUSE": "m2", "MIDDLEMOUSE": "m3",
+    "BUTTON4MOUSE": "m4", "BUTTON5MOUSE": "m5", "BUTTON6MOUSE": "m6",
+    "BUTTON7MOUSE": "m7",
+    # Mouse wheel
+    "WHEELUPMOUSE": "mwu", "WHEELDOWNMOUSE": "mwd",
+}
+
+# Event types and modifier states form a small finite set, so results are memoized
+@lru_cache(maxsize=256)
 def normalize_token(event_type: str, shift: bool = False, ctrl: bool = False, alt: bool = False, oskey: bool = False, mod_side: str = None):
     """
     Convert a Blender event into a chord token using AHK-style modifier symbols.
@@ -37,52 +86,7 @@ def normalize_token(event_type: str, shift: bool = False, ctrl: bool = False, al
     elif event_type.isdigit():
         base = event_type
     else:
-        # Common named keys - always use the base (unshifted) key name
-        named = {
-            "SPACE": "space",
-            "TAB": "tab",
-            "RET": "enter",
-            "ESC": "esc",
-            "BACK_SPACE": "backspace",
-            # Number keys (main row)
-            "ZERO": "0", "ONE": "1", "TWO": "2", "THREE": "3", "FOUR": "4",
-            "FIVE": "5", "SIX": "6", "SEVEN": "7", "EIGHT": "8", "NINE": "9",
-            # Numpad keys
-            "NUMPAD_0": "n0", "NUMPAD_1": "n1", "NUMPAD_2": "n2", "NUMPAD_3": "n3",
-            "NUMPAD_4": "n4", "NUMPAD_5": "n5", "NUMPAD_6": "n6", "NUMPAD_7": "n7",
-            "NUMPAD_8": "n8", "NUMPAD_9": "n9",
-            # Common punctuation
-            "MINUS": "-", "EQUAL": "=",
-            "LEFT_BRACKET": "[", "RIGHT_BRACKET": "]",
-            "SEMI_COLON": ";", "QUOTE": "'",
-            "COMMA": ",", "PERIOD": ".",
-            "SLASH": "/", "BACK_SLASH": "\\",
-            "GRAVE_ACCENT": "grave", "ACCENT_GRAVE": "grave",
-            "NUM_LOCK": "numlock", "CAPS_LOCK": "capslock",
-            # Arrows
-            "UP_ARROW": "up", "DOWN_ARROW": "down",
-            "LEFT_ARROW": "left", "RIGHT_ARROW": "right",
-            # Navigation
-            "PAGE_UP": "pageup", "PAGE_DOWN": "pagedown",
-            "HOME": "home", "END": "end",
-            "INSERT": "insert", "DEL": "delete",
-            # Function keys F1 - F24
-            "F1": "f1", "F2": "f2", "F3": "f3", "F4": "f4", "F5": "f5", "F6": "f6",
-            "F7": "f7", "F8": "f8", "F9": "f9", "F10": "f10", "F11": "f11", "F12": "f12",
-            "F13": "f13", "F14": "f14", "F15": "f15", "F16": "f16", "F17": "f17", "F18": "f18",
-            "F19": "f19", "F20": "f20", "F21": "f21", "F22": "f22", "F23": "f23", "F24": "f24",
-            # Numpad Operators
-            "NUMPAD_SLASH": "n/", "NUMPAD_ASTERISK": "n*",
-            "NUMPAD_MINUS": "n-", "NUMPAD_PLUS": "n+",
-            "NUMPAD_ENTER": "nenter", "NUMPAD_PERIOD": "n.",
-            # Mouse buttons 1-7
-            "LEFTMOUSE": "m1", "RIGHTMOUSE": "m2", "MIDDLEMOUSE": "m3",
-            "BUTTON4MOUSE": "m4", "BUTTON5MOUSE": "m5", "BUTTON6MOUSE": "m6",
-            "BUTTON7MOUSE": "m7",
-            # Mouse wheel
-            "WHEELUPMOUSE": "mwu", "WHEELDOWNMOUSE": "mwd",
-        }
-        base = named.get(event_type, None)
+        base = _NAMED_KEYS.get(event_type)
 
     if base is None:
         return None
@@ -149,8 +153,10 @@ def build_match_sets(mappings):
             prefixes.add(chord_tokens[:i])
     return exact, prefixes
 
-def _get_token_parts(token: str) -> tuple[set[str], str]:
-    """Split a token into a set of modifiers and a base key."""
+# Tokens recur constantly while typing and matching, so their parsed parts are memoized
+@lru_cache(maxsize=512)
+def _get_token_parts(token: str) -> tuple[frozenset[str], str]:
+    """Split a token into a frozen set of modifiers and a base key."""
     mod_symbols = {'#', '^', '!', '+'}
     found_mods = set()
     res = token
@@ -174,7 +180,7 @@ def _get_token_parts(token: str) -> tuple[set[str], str]:
         found_mods.add('+')
         base = base.lower()
 
-    return found_mods, base
+    return frozenset(found_mods), base
 
 def tokens_match(mapping_token: str, pressed_token: str) -> bool:
     """Check if a mapping token matches a pressed token, handling AHK modifiers and order."""
@@ -253,6 +259,77 @@ def find_exact_mapping(mappings, buffer_tokens):
             return m
     return None
 
+def _token_key(token: str) -> tuple[frozenset[str], str]:
+    """Get a hashable (modifiers, base) key for a chord token."""
+    return _get_token_parts(token)
+
+def build_chord_trie(mappings):
+    """
+    Build a token trie over enabled mappings for exact chord and prefix lookups.
+
+    Each node is {"children": {token_key: node}, "mappings": [(list_pos, mapping), ...],
+    "continuations": int} where token_key is the (modifiers, base) pair from _token_key
+    and continuations counts mappings that candidates_for_prefix would list below it.
+    """
+    root = {"children": {}, "mappings": [], "continuations": 0}
+    for list_pos, m in enumerate(mappings):
+        if not getattr(m, "enabled", True):
+            continue
+        chord_tokens = split_chord(get_str_attr(m, "chord"))
+        if not chord_tokens:
+            continue
+        # Meta-operators are matched but never offered as candidates
+        is_meta = (
+            get_str_attr(m, "mapping_type", "OPERATOR") == "OPERATOR"
+            and get_str_attr(m, "operator") in ("chordsong.recents", "chordsong.close_overlay")
+        )
+        node = root
+        for tok in chord_tokens:
+            if not is_meta:
+                node["continuations"] += 1
+            node = node["children"].setdefault(
+                _token_key(tok), {"children": {}, "mappings": [], "continuations": 0}
+            )
+        node["mappings"].append((list_pos, m))
+    return root
+
+def _trie_nodes_for(trie, buffer_tokens):
+    """
+    Get all trie nodes reached by buffer_tokens under tokens_match rules.
+
+    A pressed token follows both its exact key and its side-stripped key, since
+    mappings without side indicators match either side.
+    """
+    nodes = [trie]
+    for tok in buffer_tokens:
+        mods, base = _token_key(tok)
+        keys = {(mods, base), (frozenset(mod.replace('<', '').replace('>', '') for mod in mods), base)}
+        next_nodes = []
+        for node in nodes:
+            children = node["children"]
+            for key in keys:
+                child = children.get(key)
+                if child is not None:
+                    next_nodes.append(child)
+        if not next_nodes:
+            return []
+        nodes = next_nodes
+    return nodes
+
+def find_exact_mapping_in_trie(trie, buffer_tokens):
+    """Trie-based equivalent of find_exact_mapping (same matching rules, same winner)."""
+    # Earliest mapping in list order wins, as in find_exact_mapping
+    best = None
+    for node in _trie_nodes_for(trie, buffer_tokens):
+        for entry in node["mappings"]:
+            if best is None or entry[0] < best[0]:
+                best = entry
+    return best[1] if best else None
+
+def has_candidates_in_trie(trie, buffer_tokens):
+    """Trie-based equivalent of bool(candidates_for_prefix(mappings, buffer_tokens))."""
+    return any(node["continuations"] for node in _trie_nodes_for(trie, buffer_tokens))
+
 def candidates_for_prefix(mappings, buffer_tokens, context=None):
     """
     For the current prefix, list the next possible token(s) and labels.
@@ -1,20 +1,118 @@
+import time
+
 import bpy
 
 # Re-export get_str_attr from core.engine for backward compatibility
 from ..core.engine import get_str_attr
 from ..utils.addon_package import addon_root_package
+from ..ui.overlay.cache import get_mappings_revision
+
+__all__ = [
+    "prefs",
+    "schedule_autosave_safe",
+    "get_str_attr",
+    "get_mappings_by_group",
+    "get_group_mapping_indices",
+    "get_group_name_index",
+    "group_name_taken",
+]
+
+# Group indices per group name, reused while groups are unchanged
+_group_name_index_cache = {
+    "key": None,
+    "index": None,
+}
+
+# Window in which repeated autosave requests with the same delay are coalesced
+_AUTOSAVE_COALESCE_S = 0.5
 
-__all__ = ["prefs", "schedule_autosave_safe", "get_str_attr"]
+# Last autosave scheduled through schedule_autosave_safe
+_last_autosave_schedule = {
+    "time": None,
+    "delay": None,
+}
+
+# Mapping indices per group name, reused while mappings are unchanged
+_mappings_by_group_cache = {
+    "key": None,
+    "index": None,
+}
+
+# Add-on root package never changes while this module is loaded
+_ADDON_PACKAGE = addon_root_package(__package__)
 
 def prefs(context: bpy.types.Context):
     """Get addon preferences for extension workflow."""
-    package_name = addon_root_package(__package__)
-    return context.preferences.addons[package_name].preferences
+    return context.preferences.addons[_ADDON_PACKAGE].preferences
 
 def schedule_autosave_safe(prefs, delay_s=5.0):
-    """Schedule autosave with exception handling. Safe to call anywhere."""
+    """Schedule autosave with exception handling. Safe to call anywhere.
+
+    Repeated calls with the same delay within _AUTOSAVE_COALESCE_S are no-ops;
+    the already pending timer still fires after the change burst.
+    """
+    now = time.monotonic()
+    last_time = _last_autosave_schedule["time"]
+    if (last_time is not None and _last_autosave_schedule["delay"] == delay_s
+            and now - last_time < _AUTOSAVE_COALESCE_S):
+        return
     try:
         from ..core.autosave import schedule_autosave
         schedule_autosave(prefs, delay_s)
     except Exception:
-        pass
+        return
+    _last_autosave_schedule["time"] = now
+    _last_autosave_schedule["delay"] = delay_s
+
+def get_mappings_by_group(prefs):
+    """Get {group_name: [mapping_index, ...]} for all mappings (raw, unstripped names).
+
+    The index is rebuilt only when the mappings revision or count changes.
+    """
+    key = (get_mappings_revision(), len(prefs.mappings))
+    if _mappings_by_group_cache["key"] != key:
+        index = {}
+        for i, m in enumerate(prefs.mappings):
+            index.setdefault(m.group, []).append(i)
+        _mappings_by_group_cache["index"] = index
+        _mappings_by_group_cache["key"] = key
+    return _mappings_by_group_cache["index"]
+
+def get_group_mapping_indices(prefs, group_name):
+    """Get ascending indices of mappings whose group is exactly group_name.
+
+    Uses the cached index from get_mappings_by_group and falls back to a
+    full scan if the cached entries no longer match.
+    """
+    mappings = prefs.mappings
+    indices = get_mappings_by_group(prefs).get(group_name, [])
+    count = len(mappings)
+    if any(i >= count or mappings[i].group != group_name for i in indices):
+        indices = [i for i, m in enumerate(mappings) if m.group == group_name]
+    return indices
+
+def get_group_name_index(prefs):
+    """Get {group_name: [group_index, ...]} for all groups.
+
+    The index is rebuilt only when the revision or group count changes.
+    Reorders keep both, so lookups must check the stored positions.
+    """
+    key = (get_mappings_revision(), len(prefs.groups))
+    if _group_name_index_cache["key"] != key:
+        index = {}
+        for i, grp in enumerate(prefs.groups):
+            index.setdefault(grp.name, []).append(i)
+        _group_name_index_cache["key"] = key
+        _group_name_index_cache["index"] = index
+    return _group_name_index_cache["index"]
+
+def group_name_taken(prefs, name, exclude_index=-1):
+    """Check whether a group other than exclude_index is called name."""
+    groups = prefs.groups
+    indices = get_group_name_index(prefs).get(name, ())
+    count = len(groups)
+    if any(i >= count or groups[i].name != name for i in indices):
+        # Groups were reordered since the index was built
+        _group_name_index_cache["key"] = None
+        indices = get_group_name_index(prefs).get(name, ())
+    return any(i != exclude_index for i in indices)
@@ -4,6 +4,36 @@ import bpy  # type: ignore
 
 from ...utils.context_path import normalize_bpy_data_path
 
+# Operator module -> editor context for modules that map to a single editor
+_MODULE_EDITOR_CONTEXT = {
+    "uv": "IMAGE_EDITOR",
+    "image": "IMAGE_EDITOR",
+}
+
+# Operator class name (e.g. MESH_OT_primitive_cube_add) -> operator id, or None
+_OT_NAME_CACHE = {}
+
+# Splits an operator class name around its single _OT_ marker
+# Python-defined operators may use mixed case (e.g. CHORDSONG_OT_Group_Add)
+_OT_SPLIT_RE = re.compile(r'^((?:(?!_OT_)[A-Za-z0-9_])+)_OT_((?:(?!_OT_)[A-Za-z0-9_])+)$')
+
+# Placeholder written to the clipboard to detect copy_data_path_button output
+_CLIPBOARD_SENTINEL = "<chordsong-clipboard-sentinel>"
+
+# Prefixes stripped from property assignment lines
+_PROPERTY_PREFIXES = ("bpy.context.", "bpy.data.")
+
+# RNA type name fragments mapped to their context path prefix, most specific first
+_RNA_PATH_RULES = (
+    ("View3DOverlay", ("space_data", "overlay")),
+    ("View3DShading", ("space_data", "shading")),
+    ("SpaceView3D", ("space_data",)),
+    ("Scene", ("scene",)),
+    ("World", ("world",)),
+    ("ToolSettings", ("tool_settings",)),
+    ("RenderSettings", ("scene", "render")),
+)
+
 def parse_operator_from_text(text):
     """Parse operator ID and arguments from text like 'bpy.ops.uv.weld()' or 'bpy.ops.uv.weld(type="TEST")'.
 
@@ -46,37 +76,37 @@ def parse_property_from_text(text):
     if not text:
         return None, None
 
+    text = text.strip()
+
     # Exclude operator calls - they should be parsed as operators, not properties
     # Check if this looks like an operator call (bpy.ops.module.operator(...))
-    if text.strip().startswith('bpy.ops.'):
+    if text.startswith('bpy.ops.'):
         return None, None
 
-    # Handle bpy.context.XXX = YYY or bpy.data.XXX = YYY
-    # We use a permissive regex that captures everything before the first equals sign
-    # But we need to ensure the equals sign is at the top level, not inside parentheses
-    # Check if there's an opening parenthesis before the equals sign
-    equals_pos = text.find('=')
-    if equals_pos == -1:
+    # Split at the first equals sign
+    # If there's an opening parenthesis before it, this is likely an operator call
+    # with keyword arguments, not a property assignment
+    head, sep, tail = text.partition('=')
+    if not sep or '(' in head:
         return None, None
-    
-    # Check if there's an opening parenthesis before the equals sign
-    # If so, this is likely an operator call with keyword arguments, not a property assignment
-    paren_pos = text.find('(')
-    if paren_pos != -1 and paren_pos < equals_pos:
+
+    # Handle bpy.context.XXX = YYY or bpy.data.XXX = YYY
+    for prefix in _PROPERTY_PREFIXES:
+        if head.startswith(prefix):
+            head = head[len(prefix):]
+            break
+
+    path = head.strip()
+    if not path:
         return None, None
-    
-    pattern = r'^(?:bpy\.(?:context|data)\.)?(.+?)\s*=\s*(.*)$'
-    match = re.search(pattern, text)
-    if match:
-        path = match.group(1).strip()
-        value = match.group(2).strip()
-        
-        # Normalize bpy.data paths using shared utility function
+    value = tail.strip()
+
+    # Normalize bpy.data paths using shared utility function
+    # With the prefix already stripped, only indexed access (e.g. scenes["Scene"]) changes
+    if '[' in path:
         path = normalize_bpy_data_path(path)
 
-        return path, value
-
-    return None, None
+    return path, value
 
 def extract_multiple_from_info_panel(context):
     """Extract multiple operators OR properties from Info panel text or clipboard.
@@ -93,22 +123,21 @@ def extract_multiple_from_info_panel(context):
     old_clipboard = wm.clipboard
     
     # Method 1: Try to get selected report text by copying it
-    try:
-        if hasattr(bpy.ops.info, "report_copy"):
-            area = context.area
-            if area and area.type == 'INFO':
+    # report_copy only works from the Info editor, so skip the operator call elsewhere
+    area = context.area
+    if area and area.type == 'INFO':
+        try:
+            if hasattr(bpy.ops.info, "report_copy"):
                 with context.temp_override(area=area):
                     bpy.ops.info.report_copy()
-            else:
-                bpy.ops.info.report_copy()
-            
-            new_clipboard = wm.clipboard
-            if new_clipboard and new_clipboard != old_clipboard:
-                lines = new_clipboard.splitlines()
-    except Exception:
-        pass
-    finally:
-        wm.clipboard = old_clipboard
+
+                new_clipboard = wm.clipboard
+                if new_clipboard and new_clipboard != old_clipboard:
+                    lines = new_clipboard.splitlines()
+        except Exception:
+            pass
+        finally:
+            wm.clipboard = old_clipboard
 
     # Method 2: If no lines from copying, check current clipboard as fallback
     if not lines and old_clipboard:
@@ -118,30 +147,43 @@ def extract_multiple_from_info_panel(context):
         return []
 
     results = []
-    first_type = None
+    line_iter = (line.strip() for line in lines)
 
-    for line in lines:
-        line = line.strip()
+    # Phase 1: find the first parsable line; its type decides how the rest are parsed
+    first_type = None
+    for line in line_iter:
         if not line:
             continue
 
         # Try property first because operator pattern can be loose
         prop_path, prop_val = parse_property_from_text(line)
-        op, kwargs = parse_operator_from_text(line)
+        if prop_path:
+            first_type = 'PROPERTY'
+            results.append({'type': 'PROPERTY', 'path': prop_path, 'value': prop_val})
+            break
 
-        if first_type is None:
+        op, kwargs = parse_operator_from_text(line)
+        if op:
+            first_type = 'OPERATOR'
+            results.append({'type': 'OPERATOR', 'operator': op, 'kwargs': kwargs})
+            break
+
+    # Phase 2: only run the parser matching the first result on remaining lines
+    if first_type == 'PROPERTY':
+        for line in line_iter:
+            if not line:
+                continue
+            prop_path, prop_val = parse_property_from_text(line)
             if prop_path:
-                first_type = 'PROPERTY'
-                results.append({'type': 'PROPERTY', 'path': prop_path, 'value': prop_val})
-            elif op:
-                first_type = 'OPERATOR'
-                results.append({'type': 'OPERATOR', 'operator': op, 'kwargs': kwargs})
-        else:
-            if first_type == 'PROPERTY' and prop_path:
                 results.append({'type': 'PROPERTY', 'path': prop_path, 'value': prop_val})
-            elif first_type == 'OPERATOR' and op:
+    elif first_type == 'OPERATOR':
+        for line in line_iter:
+            if not line:
+                continue
+            op, kwargs = parse_operator_from_text(line)
+            if op:
                 results.append({'type': 'OPERATOR', 'operator': op, 'kwargs': kwargs})
-            
+
     return results
 
 def extract_from_info_panel(context):
@@ -159,6 +201,24 @@ def extract_from_info_panel(context):
         # which expects (operator, kwargs).
         return None, None
 
+def _ot_name_to_id(name):
+    """Convert an operator class name like 'MESH_OT_primitive_cube_add' to 'mesh.primitive_cube_add'.
+
+    Returns None if the name is not an operator class name. Results are cached
+    since operator class names are fixed for the session.
+    """
+    try:
+        return _OT_NAME_CACHE[name]
+    except KeyError:
+        pass
+
+    operator = None
+    match = _OT_SPLIT_RE.match(name)
+    if match:
+        operator = f"{match.group(1).lower()}.{match.group(2).lower()}"
+    _OT_NAME_CACHE[name] = operator
+    return operator
+
 def extract_from_button_pointer(button_pointer):
     """Try to extract operator logic from button pointer."""
     operator = None
@@ -190,28 +250,24 @@ def extract_from_button_pointer(button_pointer):
             elif isinstance(op_attr, str):
                 operator = op_attr
     elif hasattr(button_pointer, "__class__"):
-        tpname = button_pointer.__class__.__name__
-        if "_OT_" in tpname:
-            parts = tpname.split("_OT_")
-            if len(parts) == 2:
-                operator = f"{parts[0].lower()}.{parts[1].lower()}"
-                button_operator = button_pointer
+        operator = _ot_name_to_id(button_pointer.__class__.__name__)
+        if operator:
+            button_operator = button_pointer
 
     # Try rna_type
     if not button_operator and hasattr(button_pointer, "rna_type"):
         try:
             rna_type_name = button_pointer.rna_type.identifier
-            if "_OT_" in rna_type_name:
-                parts = rna_type_name.split("_OT_")
-                if len(parts) == 2:
-                    operator = f"{parts[0].lower()}.{parts[1].lower()}"
-                    # Try to get the actual operator class
-                    op_class = getattr(bpy.types, rna_type_name, None)
-                    if op_class and issubclass(op_class, bpy.types.Operator):
-                        try:
-                            button_operator = op_class()
-                        except Exception:
-                            pass
+            rna_operator = _ot_name_to_id(rna_type_name)
+            if rna_operator:
+                operator = rna_operator
+                # Try to get the actual operator class
+                op_class = getattr(bpy.types, rna_type_name, None)
+                if op_class and issubclass(op_class, bpy.types.Operator):
+                    try:
+                        button_operator = op_class()
+                    except Exception:
+                        pass
         except Exception:
             pass
 
@@ -230,16 +286,21 @@ def extract_context_path(button_prop, button_pointer, context=None):
         try:
             wm = context.window_manager
             old_clipboard = wm.clipboard
-            
-            # Use copy_data_path_button with context override to get the full path
-            with context.temp_override(button_prop=button_prop, button_pointer=button_pointer):
-                bpy.ops.ui.copy_data_path_button(full_path=True)
-            
-            new_clipboard = wm.clipboard
-            if new_clipboard and new_clipboard != old_clipboard:
+            new_clipboard = None
+
+            # Seed the clipboard with a sentinel so the copy is detected even when
+            # the path already matches the user's clipboard contents
+            wm.clipboard = _CLIPBOARD_SENTINEL
+            try:
+                # Use copy_data_path_button with context override to get the full path
+                with context.temp_override(button_prop=button_prop, button_pointer=button_pointer):
+                    bpy.ops.ui.copy_data_path_button(full_path=True)
+                new_clipboard = wm.clipboard
+            finally:
                 # Restore clipboard
                 wm.clipboard = old_clipboard
-                
+
+            if new_clipboard and new_clipboard != _CLIPBOARD_SENTINEL:
                 # Normalize bpy.data paths if present
                 normalized = normalize_bpy_data_path(new_clipboard)
                 if normalized:
@@ -267,36 +328,13 @@ def extract_context_path(button_prop, button_pointer, context=None):
     if hasattr(button_pointer, "rna_type"):
         rna_type_name = button_pointer.rna_type.identifier
 
-        # Detect View3DOverlay (overlay properties in 3D viewport)
-        if "View3DOverlay" in rna_type_name:
-            path_parts = ["space_data", "overlay", prop_name]
-
-        # Detect View3DShading (shading properties)
-        elif "View3DShading" in rna_type_name:
-            path_parts = ["space_data", "shading", prop_name]
-
-        # Detect SpaceView3D (space properties)
-        elif "SpaceView3D" in rna_type_name:
-            path_parts = ["space_data", prop_name]
-
-        # Detect Scene
-        elif "Scene" in rna_type_name:
-            path_parts = ["scene", prop_name]
-
-        # Detect World
-        elif "World" in rna_type_name:
-            path_parts = ["world", prop_name]
-
-        # Detect ToolSettings
-        elif "ToolSettings" in rna_type_name:
-            path_parts = ["tool_settings", prop_name]
-
-        # Detect RenderSettings
-        elif "Cycles" in rna_type_name and "RenderSettings" in rna_type_name:
-            path_parts = ["scene", "cycles", prop_name]
-        elif "RenderSettings" in rna_type_name:
-            path_parts = ["scene", "render", prop_name]
-
+        for needle, prefix in _RNA_PATH_RULES:
+            if needle in rna_type_name:
+                # Cycles render settings live under scene.cycles rather than scene.render
+                if needle == "RenderSettings" and "Cycles" in rna_type_name:
+                    prefix = ("scene", "cycles")
+                path_parts = [*prefix, prop_name]
+                break
         else:
             path_parts = [prop_name]
     else:
@@ -311,9 +349,10 @@ def detect_editor_context(context, operator=None, kwargs=None):
         parts = operator.split(".")
         if len(parts) == 2:
             module = parts[0].lower()
-            if module in ["uv", "image"]:
-                return "IMAGE_EDITOR"
-            elif module == "node":
+            editor = _MODULE_EDITOR_CONTEXT.get(module)
+            if editor:
+                return editor
+            if module == "node":
                 # Check kwargs for hints (e.g. type='ShaderNodeMath')
                 if kwargs:
                     if "ShaderNode" in kwargs:
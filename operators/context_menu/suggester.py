@@ -1,28 +1,56 @@
 """Suggester module for generating chord suggestions."""
 from ..common import prefs
+from ...ui.overlay.cache import get_mappings_revision
 import bpy  # type: ignore
 
+# Trie of enabled chords cached across suggest_chord calls, keyed by mappings revision
+_chord_cache = {
+    "key": None,
+    "trie": None,
+}
+
+# Marks the end of a chord inside a trie node (tokens are never None)
+_TRIE_END = None
+
+# Common words skipped when extracting initials
+_COMMON_WORDS = frozenset(("the", "a", "an", "to", "for", "of", "in", "on", "at", "by"))
+
 def get_initials(text, max_chars=3):
     """Extract initials from text, max max_chars characters."""
     if not text:
         return ""
-    # Remove common words and split
-    words = text.lower().split()
-    # Filter out very common words
-    common = {"the", "a", "an", "to", "for", "of", "in", "on", "at", "by"}
-    words = [w for w in words if w not in common]
-    if not words:
-        return ""
-
-    # Get first letter of each word, up to max_chars
-    initials = "".join(w[0] for w in words[:max_chars])
-    return initials[:max_chars]
+    # Collect first letters lazily, stopping once max_chars are found
+    initials = []
+    for word in text.lower().split():
+        if word in _COMMON_WORDS:
+            continue
+        initials.append(word[0])
+        if len(initials) == max_chars:
+            break
+    return "".join(initials)
 
 def spacify(text):
     """Add spaces between each character."""
     return " ".join(text) if text else ""
 
-def has_prefix_conflict(candidate, existing_chords):
+def _build_chord_trie(existing_chords):
+    """Build a nested-dict trie of chord tokens.
+
+    Each chord is split on whitespace; the node reached by its last token
+    is marked with the _TRIE_END key.
+    """
+    root = {}
+    for chord in existing_chords:
+        tokens = chord.split()
+        if not tokens:
+            continue
+        node = root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_TRIE_END] = True
+    return root
+
+def has_prefix_conflict(candidate, chord_trie):
     """Check if a candidate chord has a prefix conflict with existing chords.
     
     A conflict exists if:
@@ -32,29 +60,59 @@ def has_prefix_conflict(candidate, existing_chords):
     
     Args:
         candidate: The chord to check
-        existing_chords: Set of existing chord strings
+        chord_trie: Trie of existing chords built by _build_chord_trie
         
     Returns:
-        True if there's a conflict, False otherwise
+        True if there's a conflict, False otherwise. An empty candidate is a
+        prefix of every chord, so it conflicts whenever any chord exists.
     """
-    candidate_lower = candidate.strip().lower()
-    
-    for existing in existing_chords:
-        existing_lower = existing.strip().lower()
-        
-        # Exact match
-        if candidate_lower == existing_lower:
-            return True
-        
-        # Check if candidate is a prefix of existing (e.g., "m p" blocks "m p c")
-        if existing_lower.startswith(candidate_lower + " "):
-            return True
-        
-        # Check if existing is a prefix of candidate (e.g., "m p c" blocked by "m p")
-        if candidate_lower.startswith(existing_lower + " "):
+    node = chord_trie
+    for token in candidate.strip().lower().split():
+        # Existing chord ends before the candidate does (e.g. "m p" blocks "m p c")
+        if _TRIE_END in node:
             return True
-    
-    return False
+        node = node.get(token)
+        if node is None:
+            return False
+
+    # Candidate fully consumed: exact match or prefix of an existing chord
+    return bool(node)
+
+def has_prefix_conflict_in(candidate, existing_chords):
+    """Check candidate against a one-off collection of chords for a prefix conflict.
+
+    Builds the trie for this single check; see has_prefix_conflict for what counts
+    as a conflict.
+    """
+    return has_prefix_conflict(candidate, _build_chord_trie(existing_chords))
+
+def _get_chord_trie(p):
+    """Return the trie of enabled chords, reusing the cached trie while mappings are unchanged."""
+    key = (get_mappings_revision(), len(p.mappings))
+    if _chord_cache["key"] != key:
+        existing_chords = {m.chord.strip().lower() for m in p.mappings if m.enabled}
+        _chord_cache["trie"] = _build_chord_trie(existing_chords)
+        _chord_cache["key"] = key
+    return _chord_cache["trie"]
+
+def _base_candidates(group_initial, label_initials):
+    """Yield base chord candidates in order of preference."""
+    if not group_initial:
+        yield spacify(label_initials)
+        return
+
+    # Try various combinations
+    yield f"{group_initial} {spacify(label_initials)}"  # e.g., "o s a" for Object + Select All
+    yield f"{group_initial} {label_initials[0]}"  # e.g., "o s"
+    yield spacify(label_initials)  # Just label initials with spaces
+
+def _numbered_candidates(candidates):
+    """Yield candidates with a 1-9 number suffix appended."""
+    for candidate in candidates:
+        if not candidate:
+            continue
+        for i in range(1, 10):
+            yield f"{candidate} {i}"
 
 def suggest_chord(group, label):
     """Generate a smart chord suggestion based on group and label.
@@ -68,11 +126,8 @@ def suggest_chord(group, label):
     """
     p = prefs(bpy.context)
 
-    # Get existing chords for conflict checking
-    existing_chords = set()
-    for m in p.mappings:
-        if m.enabled:
-            existing_chords.add(m.chord.strip().lower())
+    # Get existing chords for conflict checking (rebuilt only when mappings change)
+    chord_trie = _get_chord_trie(p)
 
     # Generate base chord from group + label
     group_initial = get_initials(group, 1)
@@ -83,28 +138,20 @@ def suggest_chord(group, label):
         label_initials = get_initials(label, 3)
         if not label_initials:
             return ""
-        candidates = [spacify(label_initials)]
-    else:
-        # Try various combinations
-        candidates = [
-            f"{group_initial} {spacify(label_initials)}",  # e.g., "o s a" for Object + Select All
-            f"{group_initial} {label_initials[0]}",  # e.g., "o s"
-            spacify(label_initials),  # Just label initials with spaces
-        ]
+        group_initial = ""
 
     # Find first non-conflicting chord (including prefix conflicts)
-    for candidate in candidates:
-        if candidate and not has_prefix_conflict(candidate, existing_chords):
+    # Candidates are formatted on demand and remembered for the numbered fallback
+    tried = []
+    for candidate in _base_candidates(group_initial, label_initials):
+        if candidate and not has_prefix_conflict(candidate, chord_trie):
             return candidate
+        tried.append(candidate)
 
     # If all conflict, try adding a number suffix
-    for candidate in candidates:
-        if not candidate:
-            continue
-        for i in range(1, 10):
-            numbered = f"{candidate} {i}"
-            if not has_prefix_conflict(numbered, existing_chords):
-                return numbered
+    for numbered in _numbered_candidates(tried):
+        if not has_prefix_conflict(numbered, chord_trie):
+            return numbered
 
     # Last resort: return empty and let user decide
     return ""
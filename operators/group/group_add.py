@@ -7,7 +7,7 @@
 import bpy
 from bpy.props import StringProperty
 
-from ..common import prefs
+from ..common import prefs, schedule_autosave_safe
 
 class CHORDSONG_OT_Group_Add(bpy.types.Operator):
     """Add a new group."""
@@ -35,10 +35,9 @@ class CHORDSONG_OT_Group_Add(bpy.types.Operator):
             self.report({"WARNING"}, "Group name cannot be empty")
             return {"CANCELLED"}
 
-        for grp in p.groups:
-            if grp.name == name:
-                self.report({"WARNING"}, f"Group {name} already exists")
-                return {"CANCELLED"}
+        if name in {grp.name for grp in p.groups}:
+            self.report({"WARNING"}, f"Group {name} already exists")
+            return {"CANCELLED"}
 
         grp = p.groups.add()
         grp.name = name
@@ -46,7 +45,6 @@ class CHORDSONG_OT_Group_Add(bpy.types.Operator):
         # Immediately sync and sort (Unreal-style) - delayed for stability
         p.sync_groups_delayed()
 
-        from ..common import schedule_autosave_safe
         schedule_autosave_safe(p, delay_s=5.0)
 
         self.report({"INFO"}, f"Added group {name}")
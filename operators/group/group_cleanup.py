@@ -4,9 +4,11 @@
 # pyright: reportMissingModuleSource=false
 # pylint: disable=import-error,broad-exception-caught,invalid-name,import-outside-toplevel
 
+from collections import Counter
+
 import bpy
 
-from ..common import prefs
+from ..common import prefs, get_mappings_by_group, schedule_autosave_safe
 
 class CHORDSONG_OT_Group_Cleanup(bpy.types.Operator):
     """Clean up duplicate groups, normalize order indices, and sync with mappings."""
@@ -20,35 +22,30 @@ class CHORDSONG_OT_Group_Cleanup(bpy.types.Operator):
         """Execute group cleanup."""
         p = prefs(context)
 
-        # 1. Identify used group names
-        used_names = set()
-        for m in p.mappings:
-            name = (getattr(m, "group", "") or "").strip()
-            if name:
-                used_names.add(name)
-
-        # 2. Categorize groups for detailed reporting
-        empty_groups = []
-        duplicate_groups = []
-        seen_names = set()
-        
-        for grp in p.groups:
-            name = grp.name.strip() if grp.name else ""
-            if not name:
-                # Completely empty name property
-                empty_groups.append("(nameless)")
-                continue
-
-            if name in seen_names:
-                duplicate_groups.append(name)
-            elif name not in used_names:
-                empty_groups.append(name)
-            
-            seen_names.add(name)
+        # 1. Identify used group names (also caches the group -> mappings index)
+        used_names = {name.strip() for name in get_mappings_by_group(p) if name}
+        used_names.discard("")
+
+        # 2. Categorize groups for detailed reporting (single read of each group name)
+        group_names = [(grp.name or "").strip() for grp in p.groups]
+        name_counts = Counter(name for name in group_names if name)
+
+        # Completely empty name properties are reported as nameless
+        empty_groups = ["(nameless)"] * (len(group_names) - sum(name_counts.values()))
+        empty_groups.extend(name for name in name_counts if name not in used_names)
+        duplicate_groups = [name for name, count in name_counts.items() if count > 1]
+
+        # Nothing to merge, remove, add or renumber: skip the sync and the autosave
+        missing_groups = used_names.difference(name_counts)
+        orders_normalized = all(m.order_index == idx for idx, m in enumerate(p.mappings))
+        if not (empty_groups or duplicate_groups or missing_groups) and orders_normalized:
+            self.report({"INFO"}, "Groups are already clean")
+            return {"FINISHED"}
 
         # 3. Normalize order indices for all mappings
-        from ...core.config_io import _normalize_order_indices
-        _normalize_order_indices(p.mappings)
+        if not orders_normalized:
+            from ...core.config_io import _normalize_order_indices
+            _normalize_order_indices(p.mappings)
 
         # 4. Trigger the actual sync via a delayed timer for stability
         p.sync_groups_delayed(remove_unused=True)
@@ -67,7 +64,6 @@ class CHORDSONG_OT_Group_Cleanup(bpy.types.Operator):
         else:
             self.report({"INFO"}, "Groups cleaned up")
 
-        from ..common import schedule_autosave_safe
         schedule_autosave_safe(p, delay_s=5.0)
 
         return {"FINISHED"}
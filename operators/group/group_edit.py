@@ -7,7 +7,7 @@
 import bpy
 from bpy.props import IntProperty, StringProperty
 
-from ..common import prefs
+from ..common import prefs, get_group_mapping_indices, group_name_taken, schedule_autosave_safe
 
 class CHORDSONG_OT_Group_Edit(bpy.types.Operator):
     """Edit group properties (name and icon)."""
@@ -55,13 +55,14 @@ class CHORDSONG_OT_Group_Edit(bpy.types.Operator):
         layout = self.layout
         
         # Sync new_icon with group icon if it was updated externally (via icon_select)
-        # Only sync if group icon changed from initial value and differs from current new_icon
+        # Only sync when the group icon changed since it was last seen, so typed edits are kept
         p = prefs(context)
         if self.index >= 0 and self.index < len(p.groups):
             current_group_icon = p.groups[self.index].icon
-            # If group icon was updated externally (different from initial) and differs from new_icon, sync it
-            if current_group_icon != self._initial_icon and current_group_icon != self.new_icon:
-                self.new_icon = current_group_icon
+            if current_group_icon != self._initial_icon:
+                self._initial_icon = current_group_icon
+                if current_group_icon != self.new_icon:
+                    self.new_icon = current_group_icon
         
         col = layout.column()
         col.prop(self, "new_name")
@@ -89,28 +90,21 @@ class CHORDSONG_OT_Group_Edit(bpy.types.Operator):
 
         if new_name != old_name:
             # Check for duplicate names
-            for idx, grp in enumerate(p.groups):
-                if idx != self.index and grp.name == new_name:
-                    self.report({"WARNING"}, f"Group {new_name} already exists")
-                    return {"CANCELLED"}
-
-            # Update all mappings that use this group
-            count = 0
-            for m in p.mappings:
-                if m.group == old_name:
-                    m.group = new_name
-                    count += 1
+            if group_name_taken(p, new_name, self.index):
+                self.report({"WARNING"}, f"Group {new_name} already exists")
+                return {"CANCELLED"}
+
+            # Update all mappings that use this group (only the indexed hits)
+            mappings = p.mappings
+            for i in get_group_mapping_indices(p, old_name):
+                mappings[i].group = new_name
 
             p.groups[self.index].name = new_name
             
         # Update icon - always use what the user entered in the dialog
         p.groups[self.index].icon = self.new_icon
 
-        try:
-            from ...core.autosave import schedule_autosave
-            schedule_autosave(p, delay_s=5.0)
-        except Exception:
-            pass
+        schedule_autosave_safe(p, delay_s=5.0)
 
         self.report({"INFO"}, f"Updated group: {new_name}")
         return {"FINISHED"}
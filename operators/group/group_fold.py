@@ -15,8 +15,8 @@ class CHORDSONG_OT_Group_Fold_All(bpy.types.Operator):
     def execute(self, context: bpy.types.Context):
         p = prefs(context)
         p.ungrouped_expanded = False
-        for grp in p.groups:
-            grp.expanded = False
+        # Single bulk RNA write instead of one setter call per group
+        p.groups.foreach_set("expanded", [False] * len(p.groups))
         return {"FINISHED"}
 
 class CHORDSONG_OT_Group_Unfold_All(bpy.types.Operator):
@@ -28,6 +28,6 @@ class CHORDSONG_OT_Group_Unfold_All(bpy.types.Operator):
     def execute(self, context: bpy.types.Context):
         p = prefs(context)
         p.ungrouped_expanded = True
-        for grp in p.groups:
-            grp.expanded = True
+        # Single bulk RNA write instead of one setter call per group
+        p.groups.foreach_set("expanded", [True] * len(p.groups))
         return {"FINISHED"}
@@ -7,10 +7,33 @@
 import bpy
 from bpy.props import IntProperty
 
-from ..common import prefs
+from ..common import prefs, schedule_autosave_safe
 
+class _GroupMoveMixin:
+    """Shared move logic for the group Up/Down operators."""
 
-class CHORDSONG_OT_Group_Move_Up(bpy.types.Operator):
+    def _move(self, context, step):
+        """Swap the group with its neighbour at step (-1 up, +1 down)."""
+        p = prefs(context)
+
+        idx = int(self.index)
+        if idx < 0 or idx >= len(p.groups):
+            self.report({"WARNING"}, "Invalid group index")
+            return {"CANCELLED"}
+
+        target = idx + step
+        if not 0 <= target < len(p.groups):
+            # Already at the top/bottom
+            return {"CANCELLED"}
+
+        # Swap with the neighbouring group using move()
+        p.groups.move(idx, target)
+
+        schedule_autosave_safe(p, delay_s=3.0)
+
+        return {"FINISHED"}
+
+class CHORDSONG_OT_Group_Move_Up(_GroupMoveMixin, bpy.types.Operator):
     """Move group up in the list."""
 
     bl_idname = "chordsong.group_move_up"
@@ -25,27 +48,10 @@ class CHORDSONG_OT_Group_Move_Up(bpy.types.Operator):
 
     def execute(self, context):
         """Move the group up."""
-        p = prefs(context)
-
-        idx = int(self.index)
-        if idx < 0 or idx >= len(p.groups):
-            self.report({"WARNING"}, "Invalid group index")
-            return {"CANCELLED"}
-
-        if idx == 0:
-            # Already at the top
-            return {"CANCELLED"}
-
-        # Swap with previous group using move()
-        p.groups.move(idx, idx - 1)
-
-        from ..common import schedule_autosave_safe
-        schedule_autosave_safe(p, delay_s=3.0)
-
-        return {"FINISHED"}
+        return self._move(context, -1)
 
 
-class CHORDSONG_OT_Group_Move_Down(bpy.types.Operator):
+class CHORDSONG_OT_Group_Move_Down(_GroupMoveMixin, bpy.types.Operator):
     """Move group down in the list."""
 
     bl_idname = "chordsong.group_move_down"
@@ -60,21 +66,4 @@ class CHORDSONG_OT_Group_Move_Down(bpy.types.Operator):
 
     def execute(self, context):
         """Move the group down."""
-        p = prefs(context)
-
-        idx = int(self.index)
-        if idx < 0 or idx >= len(p.groups):
-            self.report({"WARNING"}, "Invalid group index")
-            return {"CANCELLED"}
-
-        if idx >= len(p.groups) - 1:
-            # Already at the bottom
-            return {"CANCELLED"}
-
-        # Swap with next group using move()
-        p.groups.move(idx, idx + 1)
-
-        from ..common import schedule_autosave_safe
-        schedule_autosave_safe(p, delay_s=3.0)
-
-        return {"FINISHED"}
+        return self._move(context, 1)
@@ -7,34 +7,57 @@
 import bpy
 from bpy.props import EnumProperty, IntProperty
 
-from ..common import prefs
+from ..common import prefs, get_group_mapping_indices, schedule_autosave_safe
+
+# Special reassignment options shown before the group list (5-tuples with icon and number)
+_SPECIAL_TARGETS = (
+    ("__CLEAR__", "None (Clear Group)", "Moves mappings to Ungrouped", "X", 0),
+    ("__DELETE__", "Delete Mappings", "Permanently delete all mappings in this group", "TRASH", 1),
+)
+
+# EnumProperty items reused across dialog redraws; reset when a dialog opens or a group is removed
+_TARGET_GROUPS_CACHE = {
+    "key": None,
+    "items": None,
+}
+
+def _clear_target_groups_cache():
+    """Drop cached target group items so the next callback rebuilds them."""
+    _TARGET_GROUPS_CACHE["key"] = None
+    _TARGET_GROUPS_CACHE["items"] = None
 
 def _get_target_groups(self, context):
     """Get list of target groups for reassignment."""
     try:
         p = prefs(context)
-        # All items must have the same tuple length (5-tuples with icon and number)
-        items = [
-            ("__CLEAR__", "None (Clear Group)", "Moves mappings to Ungrouped", "X", 0),
-            ("__DELETE__", "Delete Mappings", "Permanently delete all mappings in this group", "TRASH", 1),
-        ]
 
         # Safely get the index to exclude
         exclude_index = getattr(self, "index", -1)
-        
+
+        key = (id(p), len(p.groups), exclude_index)
+        if _TARGET_GROUPS_CACHE["key"] == key:
+            return _TARGET_GROUPS_CACHE["items"]
+
+        # All items must have the same tuple length (5-tuples with icon and number)
+        items = list(_SPECIAL_TARGETS)
+
         # Add all other groups (must also be 5-tuples)
         if hasattr(p, "groups") and p.groups:
-            item_num = 2  # Start after the two special options
-            for idx, grp in enumerate(p.groups):
-                if idx != exclude_index and grp.name and grp.name.strip():
-                    items.append((grp.name, grp.name, f"Reassign to {grp.name}", "FOLDER", item_num))
-                    item_num += 1
+            names = (
+                grp.name for idx, grp in enumerate(p.groups)
+                if idx != exclude_index and grp.name.strip()
+            )
+            # Numbers start after the two special options
+            items.extend(
+                (name, name, f"Reassign to {name}", "FOLDER", item_num)
+                for item_num, name in enumerate(names, start=len(_SPECIAL_TARGETS))
+            )
+
+        _TARGET_GROUPS_CACHE["key"] = key
+        _TARGET_GROUPS_CACHE["items"] = items
     except Exception:
         # Fallback to just the basic options
-        items = [
-            ("__CLEAR__", "None (Clear Group)", "Moves mappings to Ungrouped", "X", 0),
-            ("__DELETE__", "Delete Mappings", "Permanently delete all mappings in this group", "TRASH", 1)
-        ]
+        items = list(_SPECIAL_TARGETS)
 
     return items
 
@@ -65,10 +88,14 @@ class CHORDSONG_OT_Group_Remove(bpy.types.Operator):
             self.report({"ERROR"}, "Invalid group index")
             return {"CANCELLED"}
 
+        # Groups may have changed since the last dialog
+        _clear_target_groups_cache()
+
         group_name = p.groups[self.index].name
-        count = sum(1 for m in p.mappings if m.group == group_name)
+        # Only need to know whether any mapping uses the group
+        has_mappings = bool(get_group_mapping_indices(p, group_name))
 
-        if count > 0:
+        if has_mappings:
             # Ensure target_group is initialized with a valid value
             # Get the items first to ensure they're available
             items = _get_target_groups(self, context)
@@ -85,7 +112,8 @@ class CHORDSONG_OT_Group_Remove(bpy.types.Operator):
 
         if 0 <= self.index < len(p.groups):
             group_name = p.groups[self.index].name
-            count = sum(1 for m in p.mappings if m.group == group_name)
+            # Served from the cached group index built during invoke
+            count = len(get_group_mapping_indices(p, group_name))
 
             layout.label(text=f"Remove group {group_name}?")
             layout.label(text=f"{count} mappings use this group")
@@ -104,34 +132,29 @@ class CHORDSONG_OT_Group_Remove(bpy.types.Operator):
         # Use getattr with default in case property wasn't initialized
         target = getattr(self, "target_group", "__CLEAR__")
 
-        count = 0
+        # Indices of mappings in this group, ascending (single index lookup)
+        indices = get_group_mapping_indices(p, group_name)
+        count = len(indices)
+        mappings = p.mappings
         if target == "__DELETE__":
             # Remove mappings belonging to this group
-            to_remove = []
-            for i, m in enumerate(p.mappings):
-                if m.group == group_name:
-                    to_remove.append(i)
-            
-            # Remove from last to first to preserve indices
-            for i in reversed(to_remove):
-                p.mappings.remove(i)
-                count += 1
-        elif target == "__CLEAR__":
-            # Clear group assignment (make mappings Ungrouped)
-            for m in p.mappings:
-                if m.group == group_name:
-                    m.group = ""
-                    count += 1
+            if count == len(mappings):
+                # Every mapping is in this group: drop them in one call
+                mappings.clear()
+            else:
+                # Remove from last to first to preserve indices
+                remove = mappings.remove
+                for i in reversed(indices):
+                    remove(i)
         else:
-            # Reassign to another group
-            for m in p.mappings:
-                if m.group == group_name:
-                    m.group = target
-                    count += 1
+            # Clear group assignment (make mappings Ungrouped) or reassign to another group
+            new_group = "" if target == "__CLEAR__" else target
+            for i in indices:
+                mappings[i].group = new_group
 
         p.groups.remove(self.index)
+        _clear_target_groups_cache()
 
-        from ..common import schedule_autosave_safe
         schedule_autosave_safe(p, delay_s=5.0)
 
         if target == "__DELETE__":
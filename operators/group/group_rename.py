@@ -7,7 +7,7 @@
 import bpy
 from bpy.props import IntProperty, StringProperty
 
-from ..common import prefs
+from ..common import prefs, get_group_mapping_indices, group_name_taken, schedule_autosave_safe
 
 class CHORDSONG_OT_Group_Rename(bpy.types.Operator):
     """Rename a group and update all mappings using it."""
@@ -58,24 +58,20 @@ class CHORDSONG_OT_Group_Rename(bpy.types.Operator):
         if new_name == old_name:
             return {"FINISHED"}
 
-        for idx, grp in enumerate(p.groups):
-            if idx != self.index and grp.name == new_name:
-                self.report({"WARNING"}, f"Group {new_name} already exists")
-                return {"CANCELLED"}
+        if group_name_taken(p, new_name, self.index):
+            self.report({"WARNING"}, f"Group {new_name} already exists")
+            return {"CANCELLED"}
 
-        count = 0
-        for m in p.mappings:
-            if m.group == old_name:
-                m.group = new_name
-                count += 1
+        # Only touch mappings that belong to the renamed group
+        mappings = p.mappings
+        indices = get_group_mapping_indices(p, old_name)
+        for i in indices:
+            mappings[i].group = new_name
+        count = len(indices)
 
         p.groups[self.index].name = new_name
 
-        try:
-            from ...core.autosave import schedule_autosave
-            schedule_autosave(p, delay_s=5.0)
-        except Exception:
-            pass
+        schedule_autosave_safe(p, delay_s=5.0)
 
         self.report({"INFO"}, f"Renamed group {old_name} to {new_name} ({count} mappings updated)")
         return {"FINISHED"}
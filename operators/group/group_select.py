@@ -9,16 +9,42 @@ from bpy.props import IntProperty, EnumProperty
 
 from ..common import prefs
 
+# EnumProperty items reused across popup redraws; reset whenever the popup opens
+_AVAILABLE_GROUPS_CACHE = {
+    "key": None,
+    "items": None,
+}
+
+def _has_any_groups(p):
+    """Check whether at least one group has a name."""
+    return any(grp.name for grp in p.groups)
+
+def _clear_available_groups_cache():
+    """Drop cached group items so the next callback rebuilds them."""
+    _AVAILABLE_GROUPS_CACHE["key"] = None
+    _AVAILABLE_GROUPS_CACHE["items"] = None
+
 def _get_available_groups(_self, context):
     """Get list of available groups for selection."""
     p = prefs(context)
-    items = [("", "(No Group)", "Clear group assignment")]
 
-    for grp in p.groups:
-        if grp.name:
-            items.append((grp.name, grp.name, f"Assign to {grp.name}"))
+    key = len(p.groups)
+    if _AVAILABLE_GROUPS_CACHE["key"] == key:
+        return _AVAILABLE_GROUPS_CACHE["items"]
 
-    return items if len(items) > 1 else [("", "(No Groups)", "No groups available")]
+    if _has_any_groups(p):
+        items = [("", "(No Group)", "Clear group assignment")]
+        items.extend(
+            (name, name, f"Assign to {name}")
+            for name in (grp.name for grp in p.groups)
+            if name
+        )
+    else:
+        items = [("", "(No Groups)", "No groups available")]
+
+    _AVAILABLE_GROUPS_CACHE["key"] = key
+    _AVAILABLE_GROUPS_CACHE["items"] = items
+    return items
 
 class CHORDSONG_OT_Group_Select(bpy.types.Operator):
     """Select group from existing groups for a mapping."""
@@ -48,6 +74,9 @@ class CHORDSONG_OT_Group_Select(bpy.types.Operator):
             self.report({"ERROR"}, "Invalid mapping index")
             return {"CANCELLED"}
 
+        # Groups may have changed since the last popup
+        _clear_available_groups_cache()
+
         # Pre-select current group if it exists
         current_group = p.mappings[self.mapping_index].group
         if current_group:
@@ -2,12 +2,97 @@
 
 # pyright: reportMissingImports=false
 # pyright: reportMissingModuleSource=false
-# pylint: disable=import-error,broad-exception-caught,invalid-name,import-outside-toplevel
+# pylint: disable=import-error,broad-exception-caught,invalid-name
+
+from operator import itemgetter
 
 import bpy
 from bpy.props import IntProperty, StringProperty
 
-from .common import prefs
+from .common import prefs, schedule_autosave_safe
+from ..ui.overlay.cache import clear_overlay_cache
+
+# Editors that can host the icon/group dialogs or show mapping icons
+_REDRAW_AREA_TYPES = frozenset({"VIEW_3D", "PROPERTIES", "PREFERENCES"})
+
+def _tag_dialog_areas(context):
+    """Tag the invoking area and chordsong-related areas for redraw."""
+    try:
+        area = context.area
+        if area:
+            area.tag_redraw()
+        for window in context.window_manager.windows:
+            screen = window.screen
+            if not screen:
+                continue
+            for area in screen.areas:
+                if area.type in _REDRAW_AREA_TYPES:
+                    area.tag_redraw()
+    except Exception:
+        pass
+
+# Icons drawn per popup page; the dialog rebuilds every widget on each redraw
+_ICONS_PER_PAGE = 120
+
+def _reset_icon_page(self, _context):
+    """Jump back to the first page when the search changes."""
+    if self.page != 1:
+        self.page = 1
+
+# Sorted (original_index, button_text, name_key) tuples reused across popup redraws.
+# name_key is the lowercase name as UTF-8 bytes: substring tests on bytes use CPython's
+# fast byte search and give the same answers as on str, and byte order is code point order.
+_ICON_SORT_CACHE = {
+    "key": None,
+    "data": None,
+}
+
+def _get_sorted_icons(nerd_icons):
+    """Get icons sorted by name, cached while the icon collection is unchanged."""
+    # Icons are only populated once, so the count is enough to detect a change.
+    # id() of the collection is not used: bpy returns a new wrapper on each access.
+    key = len(nerd_icons)
+    if _ICON_SORT_CACHE["key"] != key:
+        # Read each RNA name once; the lowercase key is made here, not per draw
+        data = sorted(
+            (
+                (idx, f"{icon}  {name}", name.lower().encode("utf-8"))
+                for idx, (name, icon) in enumerate((item.name, item.icon) for item in nerd_icons)
+            ),
+            key=itemgetter(2),
+        )
+        _ICON_SORT_CACHE["key"] = key
+        _ICON_SORT_CACHE["data"] = data
+    return _ICON_SORT_CACHE["data"]
+
+# Last search result, reused on redraws and narrowed as the query grows
+_ICON_FILTER_CACHE = {
+    "data": None,
+    "query": None,
+    "matches": None,
+}
+
+def _search_key(search_filter):
+    """Get the lowercase UTF-8 search key matched against cached name keys."""
+    return search_filter.lower().encode("utf-8")
+
+def _filter_icons(data, search_key):
+    """Get entries of the sorted icon list whose name key contains search_key."""
+    cache = _ICON_FILTER_CACHE
+    if cache["data"] is data:
+        query = cache["query"]
+        if query == search_key:
+            return cache["matches"]
+        if query and query in search_key:
+            # Anything matching the longer query also matched the previous one
+            data = cache["matches"]
+    else:
+        cache["data"] = data
+
+    matches = [entry for entry in data if search_key in entry[2]]
+    cache["query"] = search_key
+    cache["matches"] = matches
+    return matches
 
 class CHORDSONG_OT_Icon_Select(bpy.types.Operator):
     """Select an icon from Nerd Fonts library."""
@@ -15,10 +100,6 @@ class CHORDSONG_OT_Icon_Select(bpy.types.Operator):
     bl_idname = "chordsong.icon_select"
     bl_label = "Select Icon"
     bl_options = {"REGISTER", "UNDO", "INTERNAL"}
-    
-    # Class variable to track if an icon was selected (to auto-close dialog)
-    _icon_selected = False
-    _close_timer_registered = False
 
     mapping_index: IntProperty(
         name="Mapping Index",
@@ -42,93 +123,67 @@ class CHORDSONG_OT_Icon_Select(bpy.types.Operator):
         name="Search",
         description="Filter icons by name",
         default="",
+        update=_reset_icon_page,
+    )
+
+    page: IntProperty(
+        name="Page",
+        description="Page of icons to show",
+        default=1,
+        min=1,
+        options={'SKIP_SAVE'},
     )
 
     def invoke(self, context, _event):
         """Show grid popup dialog."""
-        # Reset the flags when dialog opens
-        CHORDSONG_OT_Icon_Select._icon_selected = False
-        CHORDSONG_OT_Icon_Select._close_timer_registered = False
         return context.window_manager.invoke_props_dialog(self, width=600)
 
     def draw(self, context):
         """Draw grid of icons."""
         layout = self.layout
         p = prefs(context)
-        
-        # Check if an icon was selected and close the dialog
-        if CHORDSONG_OT_Icon_Select._icon_selected and not CHORDSONG_OT_Icon_Select._close_timer_registered:
-            # Use a timer to close the dialog (only register once)
-            CHORDSONG_OT_Icon_Select._close_timer_registered = True
-            def close_self():
-                try:
-                    # Find this operator instance and cancel it to close the dialog
-                    wm = bpy.context.window_manager
-                    if hasattr(wm, 'operators'):
-                        for op_id, op in list(wm.operators.items()):
-                            try:
-                                if op == self:
-                                    op.cancel(bpy.context)
-                                    break
-                            except Exception:
-                                continue
-                except Exception:
-                    pass
-                # Reset flags
-                CHORDSONG_OT_Icon_Select._icon_selected = False
-                CHORDSONG_OT_Icon_Select._close_timer_registered = False
-                return None
-            bpy.app.timers.register(close_self, first_interval=0.01)
 
         # Search box
         layout.prop(self, "search_filter", text="", icon="VIEWZOOM")
         layout.separator()
 
-        # Grid layout
-        grid = layout.grid_flow(row_major=True, columns=4, even_columns=True, even_rows=True, align=True)
+        search_filter = self.search_filter
 
-        search_lower = self.search_filter.lower()
+        icons = _get_sorted_icons(p.nerd_icons)
+        if search_filter:
+            icons = _filter_icons(icons, _search_key(search_filter))
 
-        # Create sorted list of (original_index, icon_item) tuples
-        icon_list = [(idx, icon_item) for idx, icon_item in enumerate(p.nerd_icons)]
-        icon_list.sort(key=lambda x: x[1].name.lower())
+        # Only build widgets for the current page
+        page_count = max(1, -(-len(icons) // _ICONS_PER_PAGE))
+        if page_count > 1:
+            page = min(self.page, page_count)
+            layout.prop(self, "page", text=f"Page (of {page_count})")
+            start = (page - 1) * _ICONS_PER_PAGE
+            icons = icons[start:start + _ICONS_PER_PAGE]
 
-        for idx, icon_item in icon_list:
-            # Filter by search
-            if search_lower and search_lower not in icon_item.name.lower():
-                continue
+        # Grid layout
+        grid = layout.grid_flow(row_major=True, columns=4, even_columns=True, even_rows=True, align=True)
+
+        # Same target for every button; read the dialog properties once
+        mapping_index = self.mapping_index
+        group_index = self.group_index
+        target_prop = self.target_prop
 
-            # Create button for each icon
-            col = grid.column(align=True)
-            op = col.operator(
+        for idx, text, _name_key in icons:
+            # One button per icon, glyph and name on the same line
+            op = grid.operator(
                 "chordsong.icon_select_apply",
-                text=icon_item.name,
+                text=text,
                 emboss=True,
             )
             op.icon_index = idx
-            op.mapping_index = self.mapping_index
-            op.group_index = self.group_index
-            op.target_prop = self.target_prop
+            op.mapping_index = mapping_index
+            op.group_index = group_index
+            op.target_prop = target_prop
 
-            # Show icon character below (will be gibberish but shows something)
-            sub = col.row()
-            sub.scale_y = 0.8
-            sub.alignment = 'CENTER'
-            sub.label(text=icon_item.icon)
-
-    def execute(self, context):
+    def execute(self, _context):
         """Execute is called when dialog is confirmed, but we handle selection in apply operator."""
-        # If an icon was selected, close the dialog
-        if CHORDSONG_OT_Icon_Select._icon_selected:
-            CHORDSONG_OT_Icon_Select._icon_selected = False
-            return {"FINISHED"}
         return {"FINISHED"}
-    
-    def cancel(self, context):
-        """Cancel is called when dialog is cancelled."""
-        CHORDSONG_OT_Icon_Select._icon_selected = False
-        CHORDSONG_OT_Icon_Select._close_timer_registered = False
-        pass
 
 class CHORDSONG_OT_Icon_Select_Apply(bpy.types.Operator):
     """Apply selected icon to mapping or group."""
@@ -152,22 +207,6 @@ class CHORDSONG_OT_Icon_Select_Apply(bpy.types.Operator):
 
         icon_char = p.nerd_icons[self.icon_index].icon
         
-        # Store reference to close icon_select dialog after applying
-        icon_select_op = None
-        try:
-            wm = context.window_manager
-            if hasattr(wm, 'operators'):
-                for op_id, op in wm.operators.items():
-                    try:
-                        if (hasattr(op, 'bl_idname') and 
-                            op.bl_idname == "chordsong.icon_select"):
-                            icon_select_op = op
-                            break
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-
         # Handle group editing
         if self.group_index >= 0:
             if self.group_index >= len(p.groups):
@@ -177,26 +216,7 @@ class CHORDSONG_OT_Icon_Select_Apply(bpy.types.Operator):
             # Update group icon directly
             p.groups[self.group_index].icon = icon_char
             
-            # Try to update the group edit operator's property so the dialog shows the updated icon immediately
-            # The group_edit dialog's draw() method will sync this, but we try to update it here too
-            if self.target_prop:
-                try:
-                    wm = context.window_manager
-                    # Find the active group_edit operator dialog
-                    if hasattr(wm, 'operators'):
-                        for op_id, op in wm.operators.items():
-                            try:
-                                if (hasattr(op, 'bl_idname') and 
-                                    op.bl_idname == "chordsong.group_edit" and
-                                    hasattr(op, 'index') and
-                                    op.index == self.group_index):
-                                    if hasattr(op, self.target_prop):
-                                        setattr(op, self.target_prop, icon_char)
-                                    break
-                            except Exception:
-                                continue
-                except Exception:
-                    pass
+            # The group_edit dialog's draw() picks the new icon up from the group itself
         
         # Handle mapping editing
         elif self.mapping_index >= 0:
@@ -212,38 +232,11 @@ class CHORDSONG_OT_Icon_Select_Apply(bpy.types.Operator):
             return {"CANCELLED"}
 
         # Clear overlay cache so the new icon appears immediately
-        from ..ui.overlay import clear_overlay_cache
         clear_overlay_cache()
 
-        from .common import schedule_autosave_safe
         schedule_autosave_safe(p, delay_s=5.0)
 
-        # Set flag to indicate icon was selected
-        # The icon_select dialog's draw method will check this and close itself
-        CHORDSONG_OT_Icon_Select._icon_selected = True
-        
-        # Redraw all areas to update dialogs
-        # Use a timer to ensure this happens after the current operator finishes
-        def redraw_dialogs():
-            try:
-                wm = bpy.context.window_manager
-                for window in wm.windows:
-                    try:
-                        screen = window.screen
-                        if not screen:
-                            continue
-                        for area in screen.areas:
-                            try:
-                                area.tag_redraw()
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            return None  # Timer runs once
-        
-        # Use a small delay to ensure the operator finishes first
-        bpy.app.timers.register(redraw_dialogs, first_interval=0.01)
+        # Redraw related areas to update dialogs; tags are processed after this operator returns
+        _tag_dialog_areas(context)
 
         return {"FINISHED"}
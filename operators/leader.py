@@ -4,12 +4,20 @@
 # pyright: reportMissingModuleSource=false
 # pylint: disable=import-error,broad-exception-caught
 
+import ast
 import time
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
+
 import bpy  # type: ignore
 
 from ..core.engine import (
-    candidates_for_prefix,
+    _get_token_parts,
+    build_chord_trie,
     find_exact_mapping,
+    find_exact_mapping_in_trie,
+    has_candidates_in_trie,
     humanize_chord,
     normalize_token,
     parse_kwargs,
@@ -18,7 +26,13 @@ from ..core.engine import (
 )
 from ..core.history import add_to_history
 from ..ui.overlay import draw_overlay, draw_fading_overlay
-from ..utils.render import capture_viewport_context
+from ..ui.overlay.cache import clear_overlay_cache, get_mappings_revision
+from ..utils.render import (
+    _execute_script_via_text_editor,
+    capture_viewport_context,
+    resolve_operator,
+    validate_viewport_context,
+)
 from .common import prefs
 from .test_overlay import disable_test_overlays
 
@@ -37,13 +51,265 @@ _fading_overlay_state = {
     "start_time": 0,
     "show_chord": True,  # Whether to display the chord text
     "draw_handles": {},  # Dictionary of space_type -> handle
-    "area": None,
     "invoke_area_ptr": None,  # Store area pointer for comparison
+    "prefs": None,  # Addon preferences, resolved once per overlay
+}
+
+# Event types the leader modal tracks as held modifiers
+_CTRL_KEYS = frozenset({"LEFT_CTRL", "RIGHT_CTRL"})
+_ALT_KEYS = frozenset({"LEFT_ALT", "RIGHT_ALT"})
+_SHIFT_KEYS = frozenset({"LEFT_SHIFT", "RIGHT_SHIFT"})
+_MOD_KEYS = _CTRL_KEYS | _ALT_KEYS | _SHIFT_KEYS
+
+# Multi-toggle modifier setting -> (held flag attribute, event attribute, token symbol)
+_TOGGLE_MODIFIERS = {
+    'CTRL': ('_ctrl_held', 'ctrl', '^'),
+    'ALT': ('_alt_held', 'alt', '!'),
+    'SHIFT': ('_shift_held', 'shift', '+'),
+}
+
+# High-frequency events the leader modal drops before any other work
+_IGNORED_EVENTS = frozenset({
+    "MOUSEMOVE", "INBETWEEN_MOUSEMOVE", "TIMER", "TIMER_REPORT", "TIMERREGION",
+})
+
+# Mouse buttons, which trigger chords on RELEASE rather than PRESS
+_MOUSE_BUTTONS = frozenset({
+    "LEFTMOUSE", "RIGHTMOUSE", "MIDDLEMOUSE",
+    "BUTTON4MOUSE", "BUTTON5MOUSE", "BUTTON6MOUSE", "BUTTON7MOUSE",
+})
+
+# Draw handler class for each editor type the overlays support
+_SPACE_TYPE_CLASS = {
+    'NODE_EDITOR': bpy.types.SpaceNodeEditor,
+    'IMAGE_EDITOR': bpy.types.SpaceImageEditor,
+    'SEQUENCE_EDITOR': bpy.types.SpaceSequenceEditor,
+    'VIEW_3D': bpy.types.SpaceView3D,
+}
+# Editors the leader overlay registers its draw handlers for
+_SUPPORTED_SPACE_TYPES = tuple(_SPACE_TYPE_CLASS.values())
+
+# Fading overlay lifetime and redraw interval while it fades (30ms for a smooth fade)
+_FADE_DURATION_S = 1.5
+_FADE_REDRAW_INTERVAL_S = 0.03
+
+# Chord actions still run from a timer so the modal has fully finished (needed for the
+# operator to become the F9 "last operator"); zero fires on the next event-loop pass.
+_DISPATCH_DELAY_S = 0.0
+
+# Context-filtered mapping lists per editor context, rebuilt when mappings change
+_filtered_mappings_cache = {
+    "key": None,
+    "lists": {},
+}
+
+def _get_filtered_mappings(p, context_type):
+    """Get p.mappings filtered for context_type, reused until the mappings change."""
+    key = (get_mappings_revision(), len(p.mappings))
+    if _filtered_mappings_cache["key"] != key:
+        _filtered_mappings_cache["key"] = key
+        _filtered_mappings_cache["lists"] = {}
+    lists = _filtered_mappings_cache["lists"]
+    filtered = lists.get(context_type)
+    if filtered is None:
+        filtered = lists[context_type] = filter_mappings_by_context(p.mappings, context_type)
+    return filtered
+
+# Exact-match chord tries per editor context (and per context for toggle mappings
+# only), rebuilt when mappings change
+_chord_trie_cache = {
+    "key": None,
+    "tries": {},
+}
+
+def _get_cached_trie(p, trie_key, build):
+    """Get the trie stored under trie_key, calling build() to make it if needed."""
+    key = (get_mappings_revision(), len(p.mappings))
+    if _chord_trie_cache["key"] != key:
+        _chord_trie_cache["key"] = key
+        _chord_trie_cache["tries"] = {}
+    tries = _chord_trie_cache["tries"]
+    trie = tries.get(trie_key)
+    if trie is None:
+        trie = tries[trie_key] = build()
+    return trie
+
+def _get_chord_trie(p, context_type, filtered_mappings):
+    """Get the chord trie for context_type, building it from filtered_mappings if needed."""
+    return _get_cached_trie(p, context_type, lambda: build_chord_trie(filtered_mappings))
+
+def _get_toggle_trie(p, context_type, filtered_mappings):
+    """Get the chord trie of the CONTEXT_TOGGLE mappings among filtered_mappings."""
+    return _get_cached_trie(p, (context_type, 'CONTEXT_TOGGLE'), lambda: build_chord_trie(
+        [m for m in filtered_mappings if getattr(m, 'mapping_type', None) == 'CONTEXT_TOGGLE']
+    ))
+
+# Canonical position of each modifier symbol in a token. Order: #, ^, !, +
+_MOD_ORDER = {
+    sym: rank for rank, sym in enumerate(
+        ('#', '<#', '>#', '^', '<^', '>^', '!', '<!', '>!', '+', '<+', '>+')
+    )
+}
+
+@lru_cache(maxsize=512)
+def _strip_modifier_token(token, modifier_symbol):
+    """Remove modifier_symbol (either side) from token, keeping its other modifiers.
+
+    e.g. '^+A' with modifier_symbol '^' becomes '+A'. Tokens without the modifier are
+    returned unchanged, and None when nothing is left of the token.
+    """
+    # Use _get_token_parts to properly parse tokens like <^b into base 'b'
+    mods, base = _get_token_parts(token)
+    stripped = token
+    # The configured modifier on either side, or without one
+    mod_variants = frozenset((modifier_symbol, f'<{modifier_symbol}', f'>{modifier_symbol}'))
+    # Check if this token has the configured modifier
+    if not mod_variants.isdisjoint(mods):
+        # Remove only the configured modifier, keep other modifiers
+        remaining_mods = mods - mod_variants
+        if remaining_mods:
+            # Reconstruct token with remaining modifiers in canonical order
+            stripped = ''.join(sorted(remaining_mods, key=_MOD_ORDER.__getitem__)) + base
+        else:
+            # No modifiers left, just use base (if no base, which shouldn't happen, drop it)
+            stripped = base or None
+    return stripped
+
+def _context_itself(ctx):
+    return ctx
+
+@lru_cache(maxsize=256)
+def _context_path_accessor(path):
+    """Get (owner getter, property name) for a context path like "space_data.overlay.show_stats".
+
+    The getter walks from the context to the object owning the property in a single
+    attrgetter call. Memoized: the same mapping paths come back on every toggle/property chord.
+    """
+    owner_path, sep, prop_name = path.rpartition('.')
+    return (attrgetter(owner_path) if sep else _context_itself), prop_name
+
+# Redraw tag coalescing: a tagged area stays tagged until it draws, so tagging again
+# before any overlay has drawn only repeats work Blender already has scheduled
+_REDRAW_COALESCE_S = 0.008
+_redraw_tag_state = {
+    "pending": False,
+    "time": 0.0,
+}
+
+def _tag_all_areas(force=False):
+    """Tag every area in every window for redraw, skipping repeats before the next draw."""
+    now = time.time()
+    if (not force and _redraw_tag_state["pending"]
+            and now - _redraw_tag_state["time"] < _REDRAW_COALESCE_S):
+        return
+    try:
+        for window in bpy.context.window_manager.windows:
+            screen = window.screen
+            if not screen:
+                continue
+            for area in screen.areas:
+                # Don't access area.type directly - it can crash on destroyed areas
+                # Instead, try to tag_redraw and catch exceptions
+                try:
+                    area.tag_redraw()
+                except ReferenceError:
+                    # Area is invalid or destroyed, skip it
+                    pass
+    except Exception:
+        # If anything fails, just continue - this is best effort
+        pass
+    _redraw_tag_state["pending"] = True
+    _redraw_tag_state["time"] = now
+
+def _mark_redrawn():
+    """Record that a redraw has happened, so the next tag is not coalesced."""
+    _redraw_tag_state["pending"] = False
+
+def _detect_view_3d_context(_space, context):
+    """3D View context, split into edit modes and everything else."""
+    mode = context.mode
+    if mode and mode.startswith('EDIT'):
+        return "VIEW_3D_EDIT"
+    return "VIEW_3D"
+
+def _detect_node_editor_context(space, _context):
+    """Node editor context: Geometry Nodes, or the Shader Editor for any other tree."""
+    try:
+        tree_type = space.tree_type
+    except AttributeError:
+        return "SHADER_EDITOR"
+    if tree_type == 'GeometryNodeTree':
+        return "GEOMETRY_NODE"
+    # Shader trees and other node editors use the shader editor context
+    return "SHADER_EDITOR"
+
+# Mapping context detector per editor type (space, context) -> context name;
+# unlisted editors use the 3D View context
+_CONTEXT_DETECTORS = {
+    'VIEW_3D': _detect_view_3d_context,
+    'IMAGE_EDITOR': lambda _space, _context: "IMAGE_EDITOR",
+    'NODE_EDITOR': _detect_node_editor_context,
+}
+
+def _area_space_of_type(area, space_type):
+    """Get the space of space_type in area, or None.
+
+    The active space is the one shown, so it is checked before scanning area.spaces.
+    """
+    space = area.spaces.active
+    if space is not None and space.type == space_type:
+        return space
+    for s in area.spaces:
+        if s.type == space_type:
+            return s
+    return None
+
+# Panels Leader hides per editor type, as (panel_state key, space attribute, hidden
+# only when overlay_hide_panels is on). The Asset Shelf is always hidden in the 3D View
+# (prevents overlap with bottom overlay).
+_PANEL_ATTRS = {
+    'VIEW_3D': (
+        ('asset_shelf', 'show_region_asset_shelf', False),
+        ('n_panel', 'show_region_ui', True),
+        ('t_panel', 'show_region_toolbar', True),
+    ),
+    'NODE_EDITOR': (
+        ('n_panel', 'show_region_ui', True),
+        ('t_panel', 'show_region_toolbar', True),
+    ),
+    'IMAGE_EDITOR': (
+        ('n_panel', 'show_region_ui', True),
+        ('t_panel', 'show_region_toolbar', True),
+    ),
+    'SEQUENCE_EDITOR': (
+        ('n_panel', 'show_region_ui', True),
+        ('t_panel', 'show_region_toolbar', True),
+    ),
 }
 
 # Global state for panel visibility (shared between Leader and Recents)
 _panel_states_global = {}
 
+def _find_area_by_pointer(area_ptr):
+    """Find the area whose as_pointer() is area_ptr across all windows, or None."""
+    try:
+        for window in bpy.context.window_manager.windows:
+            try:
+                screen = window.screen
+                if not screen:
+                    continue
+                for area in screen.areas:
+                    try:
+                        if area.as_pointer() == area_ptr:
+                            return area
+                    except Exception:
+                        pass
+            except Exception:
+                pass
+    except Exception:
+        pass
+    return None
+
 def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
     """Start showing a fading overlay for the executed chord.
 
@@ -59,6 +325,14 @@ def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
     # Clean up any existing overlay
     _cleanup_fading_overlay()
 
+    try:
+        p = prefs(bpy.context)
+    except (KeyError, AttributeError):
+        p = None
+    # With fading disabled there is nothing to draw, so register no handler or timer
+    if p and not getattr(p, "overlay_fading_enabled", True):
+        return
+
     # Set up new fading overlay
     state["active"] = True
     state["chord_text"] = humanize_chord(chord_tokens)
@@ -66,18 +340,17 @@ def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
     state["icon"] = icon
     state["show_chord"] = show_chord
     state["start_time"] = time.time()
+    state["prefs"] = p
     # Store area pointer for comparison during draw
     # as_pointer() gives us a stable memory address for the area
     try:
         state["invoke_area_ptr"] = _context.area.as_pointer() if (_context and _context.area) else None
     except Exception:
         state["invoke_area_ptr"] = None
-    state["area"] = None
 
     # Determine which space type to use based on the context
     # Only register handler for the specific space type where overlay was invoked
     space = None
-    space_type_class = None
 
     try:
         if _context:
@@ -85,34 +358,18 @@ def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
     except Exception:
         pass
 
+    # For unsupported space types (like PREFERENCES) or no space_data at all, fall back
+    # to View3D. The area pointer check will prevent drawing in wrong areas.
+    space_type = None
     if space:
         try:
             space_type = getattr(space, 'type', None)
-            if space_type == 'NODE_EDITOR':
-                space_type_class = bpy.types.SpaceNodeEditor
-            elif space_type == 'IMAGE_EDITOR':
-                space_type_class = bpy.types.SpaceImageEditor
-            elif space_type == 'SEQUENCE_EDITOR':
-                space_type_class = bpy.types.SpaceSequenceEditor
-            elif space_type == 'VIEW_3D':
-                space_type_class = bpy.types.SpaceView3D
-            else:
-                # For unsupported space types (like PREFERENCES), fall back to View3D
-                # The area pointer check will prevent drawing in wrong areas
-                space_type_class = bpy.types.SpaceView3D
         except Exception:
-            # If we can't access space.type, fall back to View3D
-            space_type_class = bpy.types.SpaceView3D
-    else:
-        # If there's no space_data (e.g., preferences window), fall back to View3D
-        # The area pointer check will ensure we only draw in the correct area
-        space_type_class = bpy.types.SpaceView3D
-
-    # If we still don't have a valid space type class, don't register handler
-    if not space_type_class:
-        return
+            pass
+    space_type_class = _SPACE_TYPE_CLASS.get(space_type, bpy.types.SpaceView3D)
 
     def draw_callback():
+        _mark_redrawn()
         try:
             if _is_reloading():
                 return
@@ -120,99 +377,35 @@ def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
             if not state["active"]:
                 return
 
-            # Find the original area where overlay was invoked
-            # Search through all windows/areas to find the one matching invoke_area_ptr
-            # This is necessary because bpy.context.area might be different (e.g., preferences window)
-            target_area = None
-            if state["invoke_area_ptr"] is not None:
+            # The handler runs for every area of this space type; only the invoked
+            # area shows the overlay
+            invoke_area_ptr = state["invoke_area_ptr"]
+            if invoke_area_ptr is not None:
+                area = bpy.context.area
+                if area is None:
+                    return
                 try:
-                    for window in bpy.context.window_manager.windows:
-                        try:
-                            screen = window.screen
-                            if not screen:
-                                continue
-                            for area in screen.areas:
-                                try:
-                                    if area.as_pointer() == state["invoke_area_ptr"]:
-                                        target_area = area
-                                        break
-                                except Exception:
-                                    pass
-                            if target_area:
-                                break
-                        except Exception:
-                            pass
+                    if area.as_pointer() != invoke_area_ptr:
+                        return
                 except Exception:
-                    pass
-
-            # If we couldn't find the target area, check if current context area matches
-            if not target_area and state["invoke_area_ptr"] is not None:
-                try:
-                    if bpy.context.area and bpy.context.area.as_pointer() == state["invoke_area_ptr"]:
-                        target_area = bpy.context.area
-                except Exception:
-                    pass
-
-            # If we still don't have a target area, skip drawing
-            # (This prevents showing overlay in wrong areas)
-            if state["invoke_area_ptr"] is not None and not target_area:
-                return
-
-            # Create a context override for the target area if we found it
-            # Otherwise use current context
-            if target_area:
+                    return
+
+            # The overlay only needs the size of the region being drawn, so pass it
+            # directly instead of drawing under a temp_override of the context
+            region = bpy.context.region
+            region_width = region_height = None
+            if region is not None:
+                region_width = region.width
+                region_height = region.height
+
+            # Preferences are looked up once per overlay, not on every redraw
+            p = state["prefs"]
+            if p is None:
                 try:
-                    # Try to get region from target area (usually the WINDOW region)
-                    # Don't access region.type directly - it can crash
-                    # Instead, find the largest region by area (width * height) which is typically the main viewport
-                    target_region = None
-                    max_area = 0
-                    for region in target_area.regions:
-                        try:
-                            # WINDOW regions have width and height, other regions might not
-                            # Find the largest region to avoid using small toolbars/panels
-                            w = region.width
-                            h = region.height
-                            area = w * h
-                            if area > max_area:
-                                max_area = area
-                                target_region = region
-                        except Exception:
-                            continue
-
-                    if target_region:
-                        # Create context override with target area and region
-                        with bpy.context.temp_override(area=target_area, region=target_region):
-                            try:
-                                p = prefs(bpy.context)
-                            except (KeyError, AttributeError):
-                                # Addon is being disabled/unregistered
-                                return
-                            if not p:
-                                return
-
-                            still_active = draw_fading_overlay(
-                                bpy.context, p,
-                                state["chord_text"],
-                                state["label"],
-                                state["icon"],
-                                state["start_time"],
-                                show_chord=state.get("show_chord", True)
-                            )
-
-                            if not still_active:
-                                _cleanup_fading_overlay()
-                            return
-                except Exception:
-                    # If temp_override fails, fall through to default context
-                    pass
-
-            # Fallback: use current context
-            try:
-                p = prefs(bpy.context)
-            except (KeyError, AttributeError):
-                # Addon is being disabled/unregistered
-                return
+                    p = state["prefs"] = prefs(bpy.context)
+                except (KeyError, AttributeError):
+                    # Addon is being disabled/unregistered
+                    return
             if not p:
                 return
 
@@ -222,75 +415,107 @@ def _show_fading_overlay(_context, chord_tokens, label, icon, show_chord=True):
                 state["label"],
                 state["icon"],
                 state["start_time"],
-                show_chord=state.get("show_chord", True)
+                fade_duration=_FADE_DURATION_S,
+                show_chord=state.get("show_chord", True),
+                region_width=region_width,
+                region_height=region_height,
             )
 
             if not still_active:
                 _cleanup_fading_overlay()
+        except (ReferenceError, RuntimeError):
+            # Area, region or preferences were freed under the overlay
+            _cleanup_fading_overlay()
         except Exception:
+            # Anything else is a bug: report it, and still remove the handler so it
+            # doesn't fail again on every redraw
+            import traceback
+            traceback.print_exc()
             _cleanup_fading_overlay()
 
     # Only register handler for the specific space type where overlay was invoked
-    state["draw_handles"] = {}
-    if space_type_class:
-        handle = space_type_class.draw_handler_add(draw_callback, (), "WINDOW", "POST_PIXEL")
-        state["draw_handles"][space_type_class] = handle
+    handle = space_type_class.draw_handler_add(draw_callback, (), "WINDOW", "POST_PIXEL")
+    state["draw_handles"] = {space_type_class: handle}
 
     # Helper function to tag the target area for redraw
     def tag_target_view():
-        stored_area = state.get("area")
-        if stored_area:
-            try:
-                # Don't access stored_area.type - it can crash on destroyed areas
-                # Just try to tag_redraw directly and catch any exception
-                stored_area.tag_redraw()
-            except Exception:
-                # Area is invalid, clear it and tag all relevant areas
-                state["area"] = None
-                tag_all_views()
-        else:
-            # No stored area, tag all relevant areas
-            tag_all_views()
-
-    # Helper function to tag all relevant areas for redraw
-    def tag_all_views():
-        try:
-            for window in bpy.context.window_manager.windows:
+        # Only the invoked area shows the overlay, so only it needs a redraw; fall back
+        # to tagging every area when it can't be resolved. The area is looked up on the
+        # live screens each time: a cached wrapper keeps its pointer after the area is
+        # freed and can't be trusted.
+        if state["invoke_area_ptr"] is not None:
+            target_area = _find_area_by_pointer(state["invoke_area_ptr"])
+            if target_area is not None:
                 try:
-                    screen = window.screen
-                    if not screen:
-                        continue
-                    for area in screen.areas:
-                        # Don't access area.type - it can crash on destroyed areas
-                        # Just try to tag_redraw and catch exceptions
-                        try:
-                            area.tag_redraw()
-                        except Exception:
-                            pass
+                    target_area.tag_redraw()
+                    return
                 except Exception:
                     pass
-        except Exception:
-            pass
+        tag_all_views()
+
+    # Helper function to tag all relevant areas for redraw
+    def tag_all_views():
+        _tag_all_areas()
 
     # Immediately tag for redraw
     tag_target_view()
 
     # Set up a timer to periodically redraw while fading
-    def redraw_timer():
-        if state["active"]:
-            tag_target_view()
-            return 0.03  # Redraw every 30ms for smooth fade
-        return None
+    start_time = state["start_time"]
 
+    def redraw_timer():
+        # Stop once this overlay is gone or has been replaced by a newer one,
+        # which registers its own timer
+        if not state["active"] or state["start_time"] != start_time:
+            return None
+        tag_target_view()
+        remaining = _FADE_DURATION_S - (time.time() - start_time)
+        if remaining <= 0:
+            # Last redraw: draw_callback sees the fade is over and cleans up
+            return None
+        return min(_FADE_REDRAW_INTERVAL_S, remaining)
+
+    # The first frame is already tagged above, so the timer starts one interval later
+    bpy.app.timers.register(redraw_timer, first_interval=_FADE_REDRAW_INTERVAL_S)
+
+# Context-like stand-in for _show_fading_overlay carrying the captured editor
+_OverlayContext = namedtuple("_OverlayContext", ("area", "region", "space_data"))
+
+def _show_fading_overlay_in(overlay_ctx, chord_tokens, label, icon):
+    """Show the fading overlay in the editor of a validated viewport context.
+
+    Falls back to bpy.context when overlay_ctx has no usable area and region.
+    """
+    if overlay_ctx and overlay_ctx.get("area") and overlay_ctx.get("region"):
+        try:
+            # Get space_data directly from the area (area.spaces[0] is the active space)
+            area = overlay_ctx["area"]
+            space_data = None
+            try:
+                if area.spaces:
+                    space_data = area.spaces[0]
+            except Exception:
+                pass
 
-    # Register timer with immediate first redraw
-    bpy.app.timers.register(redraw_timer, first_interval=0.01)
+            # This ensures we store the correct area pointer and space type
+            _show_fading_overlay(
+                _OverlayContext(area, overlay_ctx["region"], space_data), chord_tokens, label, icon
+            )
+            return
+        except (TypeError, RuntimeError, AttributeError, ReferenceError):
+            pass
+    _show_fading_overlay(bpy.context, chord_tokens, label, icon)
 
 def _cleanup_fading_overlay():
     """Clean up the fading overlay."""
     state = _fading_overlay_state
     state["active"] = False
+    # Resolved on the live screens, before the pointer is reset
+    target_area = None
+    if state["invoke_area_ptr"] is not None:
+        target_area = _find_area_by_pointer(state["invoke_area_ptr"])
     state["invoke_area_ptr"] = None
+    state["prefs"] = None
 
     if state["draw_handles"]:
         for st, handle in state["draw_handles"].items():
@@ -301,15 +526,33 @@ def _cleanup_fading_overlay():
         state["draw_handles"] = {}
 
     # Tag only the target area for redraw to clear the overlay
-    if state["area"]:
+    if target_area is not None:
         try:
-            state["area"].tag_redraw()
+            target_area.tag_redraw()
         except Exception:
             pass
 
 
+# Leader whose overlay the persistent draw handlers render (None when no leader is running)
+_active_leader = None
+
+def _leader_draw_dispatch():
+    """Persistent draw handler: draw the running leader's overlay, if any."""
+    global _active_leader
+    _mark_redrawn()
+    leader = _active_leader
+    if leader is None:
+        return
+    try:
+        leader._draw_callback()
+    except ReferenceError:
+        # Operator was freed without finishing; stop drawing for it
+        _active_leader = None
+
 def cleanup_all_handlers():
     """Clean up all draw handlers and timers. Called on addon unregister."""
+    global _active_leader
+    _active_leader = None
     _cleanup_fading_overlay()
     disable_test_overlays()
     # Remove Leader overlay draw handlers (class-level)
@@ -335,7 +578,6 @@ def cleanup_all_handlers():
         pass
     # Clear overlay cache so no stale refs to layout/GPU-related data
     try:
-        from ..ui.overlay.cache import clear_overlay_cache
         clear_overlay_cache()
     except Exception:
         pass
@@ -374,11 +616,11 @@ class CHORDSONG_OT_ResetState(bpy.types.Operator):
         # 4. Force tag all areas for redraw to clear any stale overlays
         try:
             for window in context.window_manager.windows:
-                for area in window.screen.areas:
-                    try:
-                        area.tag_redraw()
-                    except Exception:
-                        pass
+                screen = window.screen
+                if not screen:
+                    continue
+                for area in screen.areas:
+                    area.tag_redraw()
         except Exception:
             pass
 
@@ -412,6 +654,8 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
     _invoke_area_ptr = None  # Store area pointer for comparison
     _scroll_offset = 0
     _context_type = None  # Store the detected context type
+    _prefs = None  # Addon preferences resolved in invoke
+    _toggle_modifier = (None, None, '')  # _TOGGLE_MODIFIERS entry for the multi-toggle modifier
     _last_mod_type = None  # Store the type of the last modifier key
     _panel_states = {}  # Store original panel visibility states: {area_ptr: {"n_panel": bool, "t_panel": bool}}
     _ctrl_held = False  # Track modifier keys for multi-toggle feature
@@ -446,8 +690,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             return False
 
     def _ensure_draw_handler(self, context: bpy.types.Context):
+        global _active_leader
         p = prefs(context)
-        if not p.overlay_enabled or self._draw_handles:
+        if not p.overlay_enabled or _active_leader is self:
             return
 
         # Store area pointer for comparison during draw
@@ -456,56 +701,29 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         self._area = context.area
         self._region = context.region
 
-        # Register handlers for all major space types to ensure visibility across split views
-        self._draw_handles = {}
-        supported_types = [
-            bpy.types.SpaceView3D,
-            bpy.types.SpaceNodeEditor,
-            bpy.types.SpaceImageEditor,
-            bpy.types.SpaceSequenceEditor,
-        ]
+        # Register handlers for all major space types to ensure visibility across split views.
+        # They are added once and kept (class-level) until cleanup_all_handlers, so repeated
+        # leader presses don't add/remove handlers; the dispatcher draws only while active.
+        handles = CHORDSONG_OT_Leader._draw_handles
+        if not handles:
+            for st in _SUPPORTED_SPACE_TYPES:
+                handles[st] = st.draw_handler_add(_leader_draw_dispatch, (), "WINDOW", "POST_PIXEL")
 
-        for st in supported_types:
-            handle = st.draw_handler_add(self._draw_callback, (), "WINDOW", "POST_PIXEL")
-            self._draw_handles[st] = handle
+        _active_leader = self
 
     def _remove_draw_handler(self):
-        if not self._draw_handles:
-            return
-        for st, handle in self._draw_handles.items():
-            try:
-                st.draw_handler_remove(handle, "WINDOW")
-            except Exception:
-                pass
-        self._draw_handles = {}
+        global _active_leader
+        if _active_leader is self:
+            _active_leader = None
 
-    def _tag_redraw(self):
-        """Tag all relevant areas for redraw to ensure overlay is visible."""
-        try:
-            # Tag all relevant areas since we don't store area references anymore
-            # This ensures the overlay shows up regardless of which area is active
-            # But we must be very careful not to access area.type on partially destroyed areas
-            for window in bpy.context.window_manager.windows:
-                try:
-                    screen = window.screen
-                    if not screen:
-                        continue
-                    for area in screen.areas:
-                        # Don't access area.type directly - it can crash on destroyed areas
-                        # Instead, try to tag_redraw and catch exceptions
-                        try:
-                            # Try to tag - if area is valid, this will work
-                            # If area is destroyed, this will raise an exception
-                            area.tag_redraw()
-                        except Exception:
-                            # Area is invalid or destroyed, skip it
-                            pass
-                except Exception:
-                    # Window or screen is invalid, skip it
-                    pass
-        except Exception:
-            # If anything fails, just continue - this is best effort
-            pass
+    def _tag_redraw(self, force=False):
+        """Tag all relevant areas for redraw to ensure overlay is visible.
+
+        Repeat tags before the next draw are coalesced unless force is set.
+        """
+        # Tag all relevant areas since we don't store area references anymore
+        # This ensures the overlay shows up regardless of which area is active
+        _tag_all_areas(force)
 
     def _draw_callback(self):
         """Draw callback for the overlay."""
@@ -513,15 +731,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             return
         # Use bpy.context directly - it's more reliable for draw handlers
         context = bpy.context
-        try:
-            p = prefs(context)
-        except (KeyError, AttributeError):
-            # Addon is being disabled/unregistered, preferences no longer available
-            return
-        if not p.overlay_enabled:
-            return
 
-        # Only draw in the area where leader was invoked
+        # Only draw in the area where leader was invoked; checked first, since the
+        # handlers run for every area of each supported editor type
         # Compare area pointers - as_pointer() gives stable memory addresses
         if self._invoke_area_ptr is not None and context.area is not None:
             try:
@@ -530,6 +742,11 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             except Exception:
                 pass  # If we can't get pointer, just draw
 
+        # Preferences resolved in invoke, reused for every redraw of this leader
+        p = self._prefs
+        if not p.overlay_enabled:
+            return
+
         # Use the stored region from invoke if available to prevent crashes when
         # context.region is None or invalid (e.g., in new files, custom scripts, overlays)
         if self._region:
@@ -545,7 +762,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             context = ContextWithRegion(bpy.context, self._region, self._area)
 
         # Filter mappings by context for overlay display
-        filtered_mappings = filter_mappings_by_context(p.mappings, self._context_type)
+        filtered_mappings = _get_filtered_mappings(p, self._context_type)
 
         # Use the buffer tokens for overlay rendering with filtered mappings
         buffer_tokens = self._buffer or []
@@ -556,8 +773,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         """Start chord capture modal operation."""
         # Clean up any active test overlays
         disable_test_overlays()
-        p = prefs(context)
+        p = self._prefs = prefs(context)
         p.ensure_defaults()
+        self._toggle_modifier = _TOGGLE_MODIFIERS.get(p.toggle_multi_modifier, (None, None, ''))
 
         self._buffer = []
         self._scroll_offset = 0
@@ -568,10 +786,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         # Store the leader key to ignore its first RELEASE if it's a mouse button
         # This prevents double-triggering when mouse buttons are used as leader key
         self._leader_key_type = get_leader_key_type()
-        self._ignore_leader_release = event.type in {
-            "LEFTMOUSE", "RIGHTMOUSE", "MIDDLEMOUSE",
-            "BUTTON4MOUSE", "BUTTON5MOUSE", "BUTTON6MOUSE", "BUTTON7MOUSE"
-        } and event.type == self._leader_key_type
+        self._ignore_leader_release = (
+            event.type in _MOUSE_BUTTONS and event.type == self._leader_key_type
+        )
 
         # Detect the current editor context
         self._context_type = self._detect_context(context)
@@ -588,22 +805,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         """Detect the current editor context."""
         space = context.space_data
         if space:
-            space_type = space.type
-            if space_type == 'VIEW_3D':
-                if context.mode and context.mode.startswith('EDIT'):
-                    return "VIEW_3D_EDIT"
-                return "VIEW_3D"
-            elif space_type == 'IMAGE_EDITOR':
-                return "IMAGE_EDITOR"
-            elif space_type == 'NODE_EDITOR':
-                # Check if it's Geometry Nodes or Shader Editor
-                if hasattr(space, 'tree_type'):
-                    if space.tree_type == 'GeometryNodeTree':
-                        return "GEOMETRY_NODE"
-                    elif space.tree_type == 'ShaderNodeTree':
-                        return "SHADER_EDITOR"
-                # Default to shader editor for other node editors
-                return "SHADER_EDITOR"
+            detector = _CONTEXT_DETECTORS.get(space.type)
+            if detector:
+                return detector(space, context)
         # Default to 3D View if we can't detect
         return "VIEW_3D"
 
@@ -621,8 +825,13 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         invoke_space = context.space_data
         invoke_space_type = invoke_space.type if invoke_space else 'VIEW_3D'
 
-        # Supported editor types that have T and N panels
-        supported_types = {'VIEW_3D', 'NODE_EDITOR', 'IMAGE_EDITOR', 'SEQUENCE_EDITOR'}
+        # Panels this editor type has, minus T and N unless the toggle is enabled
+        panel_attrs = tuple(
+            entry for entry in _PANEL_ATTRS.get(invoke_space_type, ())
+            if hide_tn or not entry[2]
+        )
+        if not panel_attrs:
+            return
 
         # Iterate through all areas in all windows
         for window in context.window_manager.windows:
@@ -638,45 +847,28 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         if area.type != invoke_space_type:
                             continue
 
-                        # Skip if this editor type doesn't support panels
-                        if area.type not in supported_types:
-                            continue
-
                         # Get the space data
-                        space = None
-                        for s in area.spaces:
-                            if s.type == invoke_space_type:
-                                space = s
-                                break
+                        space = _area_space_of_type(area, invoke_space_type)
 
                         if not space:
                             continue
 
-                        area_ptr = area.as_pointer()
+                        # Only panels that were actually hidden are recorded, so restoring
+                        # is a plain write per recorded panel with no read back
                         panel_state = {}
-
-                        # Always hide Asset Shelf in 3D View (prevents overlap with bottom overlay)
-                        if area.type == 'VIEW_3D' and hasattr(space, 'show_region_asset_shelf'):
-                            panel_state['asset_shelf'] = space.show_region_asset_shelf
-                            if space.show_region_asset_shelf:
-                                space.show_region_asset_shelf = False
-
-                        # Store and hide N panel (Sidebar) - only if toggle enabled
-                        if hide_tn and hasattr(space, 'show_region_ui'):
-                            panel_state['n_panel'] = space.show_region_ui
-                            if space.show_region_ui:
-                                space.show_region_ui = False
-
-                        # Store and hide T panel (Toolbar/Toolshelf) - only if toggle enabled
-                        if hide_tn and hasattr(space, 'show_region_toolbar'):
-                            panel_state['t_panel'] = space.show_region_toolbar
-                            if space.show_region_toolbar:
-                                space.show_region_toolbar = False
+                        for key, attr, _tn_only in panel_attrs:
+                            try:
+                                if getattr(space, attr):
+                                    setattr(space, attr, False)
+                                    panel_state[key] = True
+                            except AttributeError:
+                                # Not available in this Blender version (e.g. Asset Shelf)
+                                continue
 
                         if panel_state:
                             # Store space type for restoration
                             panel_state['space_type'] = invoke_space_type
-                            self._panel_states[area_ptr] = panel_state
+                            self._panel_states[area.as_pointer()] = panel_state
                     except Exception:
                         continue
             except Exception:
@@ -694,14 +886,15 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 if not screen:
                     continue
                 for area in screen.areas:
-                    if not self._is_area_valid(area):
+                    # Areas without stored state are skipped on their pointer alone,
+                    # before the validity probe
+                    try:
+                        panel_state = self._panel_states.get(area.as_pointer())
+                    except Exception:
+                        continue
+                    if panel_state is None or not self._is_area_valid(area):
                         continue
                     try:
-                        area_ptr = area.as_pointer()
-                        if area_ptr not in self._panel_states:
-                            continue
-
-                        panel_state = self._panel_states[area_ptr]
                         space_type = panel_state.get('space_type', 'VIEW_3D')
 
                         # Only restore panels in areas matching the stored space type
@@ -709,29 +902,19 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                             continue
 
                         # Get the space data
-                        space = None
-                        for s in area.spaces:
-                            if s.type == space_type:
-                                space = s
-                                break
+                        space = _area_space_of_type(area, space_type)
 
                         if not space:
                             continue
 
-                        # Restore Asset Shelf
-                        if 'asset_shelf' in panel_state and hasattr(space, 'show_region_asset_shelf'):
-                            if space.show_region_asset_shelf != panel_state['asset_shelf']:
-                                space.show_region_asset_shelf = panel_state['asset_shelf']
-
-                        # Restore N panel (Sidebar)
-                        if 'n_panel' in panel_state and hasattr(space, 'show_region_ui'):
-                            if space.show_region_ui != panel_state['n_panel']:
-                                space.show_region_ui = panel_state['n_panel']
-
-                        # Restore T panel (Toolbar/Toolshelf)
-                        if 't_panel' in panel_state and hasattr(space, 'show_region_toolbar'):
-                            if space.show_region_toolbar != panel_state['t_panel']:
-                                space.show_region_toolbar = panel_state['t_panel']
+                        # Restore Asset Shelf, N panel (Sidebar) and T panel (Toolbar/Toolshelf)
+                        for key, attr, _tn_only in _PANEL_ATTRS.get(space_type, ()):
+                            if key not in panel_state:
+                                continue
+                            try:
+                                setattr(space, attr, panel_state[key])
+                            except AttributeError:
+                                continue
                     except Exception:
                         continue
             except Exception:
@@ -749,7 +932,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         if restore_panels:
             self._restore_panels(context)
         self._remove_draw_handler()
-        self._tag_redraw()
+        self._tag_redraw(force=True)
 
     def cancel(self, context: bpy.types.Context):  # pylint: disable=unused-argument
         """Clean up when operator is interrupted.
@@ -774,11 +957,13 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             return {"CANCELLED"}
 
     def _modal_inner(self, context: bpy.types.Context, event: bpy.types.Event):
+        # Cursor motion and timer ticks arrive constantly and never form a token
+        if event.type in _IGNORED_EVENTS:
+            return {"RUNNING_MODAL"}
         if _is_reloading():
             self._finish(context)
             return {"CANCELLED"}
         global _panel_states_global
-        p = prefs(context)
 
         # Cancel key (ESC only - removed RIGHTMOUSE to allow m2 as chord token)
         if event.type == "ESC" and event.value == "PRESS":
@@ -799,46 +984,23 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 return {"CANCELLED"}
 
         # Handle modifier key events BEFORE checking event.value to catch RELEASE events
-        # Track CTRL
-        if event.type in {"LEFT_CTRL", "RIGHT_CTRL"}:
-            if event.value == "RELEASE":
-                self._ctrl_held = False
-                self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
-            elif event.value == "PRESS":
-                self._ctrl_held = True
-                self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
-
-        # Track ALT
-        if event.type in {"LEFT_ALT", "RIGHT_ALT"}:
-            if event.value == "RELEASE":
-                self._alt_held = False
-                self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
-            elif event.value == "PRESS":
-                self._alt_held = True
-                self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
-
-        # Track SHIFT
-        if event.type in {"LEFT_SHIFT", "RIGHT_SHIFT"}:
-            if event.value == "RELEASE":
-                self._shift_held = False
-                self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
-            elif event.value == "PRESS":
-                self._shift_held = True
+        # (a single membership test, so other events skip the per-modifier checks)
+        if event.type in _MOD_KEYS:
+            if event.value in {"PRESS", "RELEASE"}:
+                held = event.value == "PRESS"
+                if event.type in _CTRL_KEYS:
+                    self._ctrl_held = held
+                elif event.type in _ALT_KEYS:
+                    self._alt_held = held
+                else:
+                    self._shift_held = held
                 self._last_mod_type = event.type
-                return {"RUNNING_MODAL"}
+            return {"RUNNING_MODAL"}
 
         # Mouse buttons should trigger on RELEASE to avoid conflicts with Blender's default actions
         # (e.g., M3 triggering rotate view on PRESS, getting stuck if we consume the event)
-        is_mouse_button = event.type in {
-            "LEFTMOUSE", "RIGHTMOUSE", "MIDDLEMOUSE", 
-            "BUTTON4MOUSE", "BUTTON5MOUSE", "BUTTON6MOUSE", "BUTTON7MOUSE"
-        }
-        
+        is_mouse_button = event.type in _MOUSE_BUTTONS
+
         # For mouse buttons, wait for RELEASE; for everything else (including wheel), wait for PRESS
         if is_mouse_button:
             if event.value != "RELEASE":
@@ -858,16 +1020,8 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 mod_side = "RIGHT"
 
         # Normal token normalization - CTRL is always included in the token
-        ctrl_held = getattr(self, '_ctrl_held', False) or event.ctrl
-
-        tok = normalize_token(
-            event.type,
-            shift=event.shift,
-            ctrl=event.ctrl,
-            alt=event.alt,
-            oskey=event.oskey,
-            mod_side=mod_side
-        )
+        # Positional arguments keep normalize_token's memo key a flat tuple
+        tok = normalize_token(event.type, event.shift, event.ctrl, event.alt, event.oskey, mod_side)
 
         if tok is None:
             return {"RUNNING_MODAL"}
@@ -879,17 +1033,19 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         if event.is_repeat:
             return {"RUNNING_MODAL"}
 
+        p = self._prefs
+
         # Fallback: double-leader opens Recents if no mapping claims the leader key
         leader_key = get_leader_key_type()
         if not self._buffer and event.type == leader_key:
             # Check if any enabled mapping has a single-token chord for this key
             leader_token = normalize_token(leader_key)
-            filtered = filter_mappings_by_context(p.mappings, self._context_type)
+            filtered = _get_filtered_mappings(p, self._context_type)
             claimed = find_exact_mapping(filtered, [leader_token])
             if not claimed:
                 # No mapping claims the leader key — open Recents (default behavior)
                 if self._panel_states:
-                    _panel_states_global = self._panel_states.copy()
+                    _panel_states_global = self._panel_states
                     self._panel_states = {}
                 self._finish(context, restore_panels=False)
                 try:
@@ -897,7 +1053,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 except Exception as e:
                     print(f"Chord Song: Failed to open recents: {e}")
                     if _panel_states_global:
-                        self._panel_states = _panel_states_global.copy()
+                        self._panel_states = _panel_states_global
                         self._restore_panels(context)
                         _panel_states_global = {}
                 return {"FINISHED"}
@@ -909,70 +1065,38 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
         self._scroll_offset = 0  # Reset scroll when adding to buffer
 
         # Filter mappings by context
-        filtered_mappings = filter_mappings_by_context(p.mappings, self._context_type)
+        filtered_mappings = _get_filtered_mappings(p, self._context_type)
 
-        # Try exact match with current buffer
-        m = find_exact_mapping(filtered_mappings, self._buffer)
+        # Try exact match with current buffer (single trie descent instead of a mappings scan)
+        m = find_exact_mapping_in_trie(
+            _get_chord_trie(p, self._context_type, filtered_mappings), self._buffer
+        )
 
         # If no match and a modifier is held, try matching without that modifier token
         # This handles cases where user presses Modifier+key but the mapping is just "key"
-        # Get the configured multi-toggle modifier
-        p = prefs(context)
-        toggle_modifier = p.toggle_multi_modifier
-
-        # Check if the configured modifier is held
-        modifier_held = False
-        modifier_symbol = ''
-        if toggle_modifier == 'CTRL':
-            modifier_held = ctrl_held
-            modifier_symbol = '^'
-        elif toggle_modifier == 'ALT':
-            modifier_held = getattr(self, '_alt_held', False) or event.alt
-            modifier_symbol = '!'
-        elif toggle_modifier == 'SHIFT':
-            modifier_held = getattr(self, '_shift_held', False) or event.shift
-            modifier_symbol = '+'
+        # Check if the configured multi-toggle modifier (resolved in invoke) is held
+        held_attr, event_attr, modifier_symbol = self._toggle_modifier
+        modifier_held = bool(held_attr) and (getattr(self, held_attr) or getattr(event, event_attr))
 
         if not m and modifier_held:
-            # Extract base keys from tokens that have the configured modifier
-            # Use _get_token_parts to properly parse tokens like <^b into base 'b'
-            from ..core.engine import _get_token_parts
+            # Strip the configured modifier from each token (table lookups after the
+            # first time a token is seen)
             buffer_without_modifier = []
             for t in self._buffer:
-                mods, base = _get_token_parts(t)
-                # Check if this token has the configured modifier
-                has_modifier = modifier_symbol in mods or f'<{modifier_symbol}' in mods or f'>{modifier_symbol}' in mods
-                if has_modifier:
-                    # Remove only the configured modifier, keep other modifiers
-                    # e.g., '^+A' with modifier_symbol '^' becomes '+A'
-                    remaining_mods = mods - {modifier_symbol, f'<{modifier_symbol}', f'>{modifier_symbol}'}
-                    if remaining_mods:
-                        # Reconstruct token with remaining modifiers in correct order
-                        # Order: #, ^, !, +
-                        ordered_mods = []
-                        for mod_sym in ['#', '<#', '>#', '^', '<^', '>^', '!', '<!', '>!', '+', '<+', '>+']:
-                            if mod_sym in remaining_mods:
-                                ordered_mods.append(mod_sym)
-                        reconstructed = ''.join(ordered_mods) + base
-                        buffer_without_modifier.append(reconstructed)
-                    elif base:
-                        # No modifiers left, just use base
-                        buffer_without_modifier.append(base)
-                    # If no base (shouldn't happen), skip this token
-                else:
-                    # No matching modifier, keep token as-is
-                    buffer_without_modifier.append(t)
+                stripped = _strip_modifier_token(t, modifier_symbol)
+                if stripped is not None:
+                    buffer_without_modifier.append(stripped)
 
             if buffer_without_modifier != self._buffer:
                 # Buffer had modifier tokens, try matching without them
-                toggle_mappings = [m for m in filtered_mappings if getattr(m, 'mapping_type', None) == 'CONTEXT_TOGGLE']
-                if toggle_mappings:
-                    toggle_match = find_exact_mapping(toggle_mappings, buffer_without_modifier)
-                    if toggle_match:
-                        # Found a toggle match without modifier - use that
-                        m = toggle_match
-                        # Update buffer to remove modifier tokens for consistency
-                        self._buffer = buffer_without_modifier
+                toggle_match = find_exact_mapping_in_trie(
+                    _get_toggle_trie(p, self._context_type, filtered_mappings), buffer_without_modifier
+                )
+                if toggle_match:
+                    # Found a toggle match without modifier - use that
+                    m = toggle_match
+                    # Update buffer to remove modifier tokens for consistency
+                    self._buffer = buffer_without_modifier
         if m:
             # Short-circuit for meta-operators (no fading overlay, no history)
             operator_id = (getattr(m, "operator", "") or "").strip()
@@ -981,7 +1105,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 return {"CANCELLED"}
             if operator_id == "chordsong.recents":
                 if self._panel_states:
-                    _panel_states_global = self._panel_states.copy()
+                    _panel_states_global = self._panel_states
                     self._panel_states = {}
                 self._finish(context, restore_panels=False)
                 try:
@@ -990,7 +1114,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 except Exception as e:
                     print(f"Chord Song: Failed to open recents: {e}")
                     if _panel_states_global:
-                        self._panel_states = _panel_states_global.copy()
+                        self._panel_states = _panel_states_global
                         self._restore_panels(context)
                         _panel_states_global = {}
                 return {"FINISHED"}
@@ -1001,8 +1125,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             label = getattr(m, "label", "") or "(no label)"
             icon = getattr(m, "icon", "") or ""
 
-            # Capture the buffer before finishing
-            chord_tokens = list(self._buffer)
+            # Take the buffer over rather than copying it: every path below either finishes
+            # the modal or (multi-toggle) sets a new buffer
+            chord_tokens, self._buffer = self._buffer, []
 
             # Handle Python script execution
             if mapping_type == "PYTHON_FILE":
@@ -1014,7 +1139,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
 
                 python_file = (getattr(m, "python_file", "") or "").strip()
                 if not python_file:
-                    self.report({"WARNING"}, f'Chord "{" ".join(self._buffer)}" has no script file')
+                    self.report({"WARNING"}, f'Chord "{" ".join(chord_tokens)}" has no script file')
                     self._finish(context)
                     return {"CANCELLED"}
 
@@ -1039,7 +1164,6 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 def execute_script_delayed():
                     try:
                         # Validate context before using it (may be invalid after undo)
-                        from ..utils.render import validate_viewport_context, _execute_script_via_text_editor
                         valid_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
 
                         # Execute using Blender's text editor (avoids exec/runpy)
@@ -1057,32 +1181,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         # Show fading overlay using the original captured context (ctx_viewport)
                         # This ensures overlay appears in the editor where leader was invoked
                         overlay_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
-                        if overlay_ctx and overlay_ctx.get("area") and overlay_ctx.get("region"):
-                            try:
-                                # Get space_data directly from the area (area.spaces[0] is the active space)
-                                area = overlay_ctx["area"]
-                                region = overlay_ctx["region"]
-                                space_data = None
-                                try:
-                                    if area.spaces:
-                                        space_data = area.spaces[0]
-                                except Exception:
-                                    pass
-
-                                # Create a context-like object with the area from overlay_ctx
-                                # This ensures we store the correct area pointer and space type
-                                class ContextWrapper:
-                                    def __init__(self, area, region, space_data):
-                                        self.area = area
-                                        self.region = region
-                                        self.space_data = space_data
-
-                                wrapped_ctx = ContextWrapper(area, region, space_data)
-                                _show_fading_overlay(wrapped_ctx, chord_tokens, label, icon)
-                            except (TypeError, RuntimeError, AttributeError, ReferenceError):
-                                _show_fading_overlay(bpy.context, chord_tokens, label, icon)
-                        else:
-                            _show_fading_overlay(bpy.context, chord_tokens, label, icon)
+                        _show_fading_overlay_in(overlay_ctx, chord_tokens, label, icon)
 
                         # Add to history
                         add_to_history(
@@ -1102,50 +1201,37 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         traceback.print_exc()
                     return None
 
-                bpy.app.timers.register(execute_script_delayed, first_interval=0.01)
+                bpy.app.timers.register(execute_script_delayed, first_interval=_DISPATCH_DELAY_S)
                 return {"FINISHED"}
 
             # Handle context toggle execution
             if mapping_type == "CONTEXT_TOGGLE":
                 context_path = (getattr(m, "context_path", "") or "").strip()
                 if not context_path:
-                    self.report({"ERROR"}, f'Toggle mapping "{" ".join(self._buffer)}" has no context path. Please fix in preferences.')
-                    print(f"Chord Song: Toggle mapping '{' '.join(self._buffer)}' is missing context_path property")
+                    self.report({"ERROR"}, f'Toggle mapping "{" ".join(chord_tokens)}" has no context path. Please fix in preferences.')
+                    print(f"Chord Song: Toggle mapping '{' '.join(chord_tokens)}' is missing context_path property")
                     self._finish(context)
                     return {"CANCELLED"}
 
                 # Validate that the context path has at least one part
                 if '.' not in context_path:
                     self.report({"ERROR"}, f'Invalid context path "{context_path}" - must include context (e.g., "space_data.overlay.show_stats")')
-                    print(f"Chord Song: Invalid context path '{context_path}' for chord '{' '.join(self._buffer)}'")
+                    print(f"Chord Song: Invalid context path '{context_path}' for chord '{' '.join(chord_tokens)}'")
                     self._finish(context)
                     return {"CANCELLED"}
 
                 # Capture viewport context BEFORE modifying buffer
                 ctx_viewport = capture_viewport_context(context)
 
-                # Check if configured modifier is held - if so, remove last token and keep modal open
-                # Get the configured modifier from preferences
-                p = prefs(context)
-                toggle_modifier = p.toggle_multi_modifier  # 'CTRL', 'ALT', 'SHIFT', or 'OSKEY'
-
-                # Check if the configured modifier is held
-                modifier_held = False
-                if toggle_modifier == 'CTRL':
-                    modifier_held = getattr(self, '_ctrl_held', False) or event.ctrl
-                elif toggle_modifier == 'ALT':
-                    modifier_held = getattr(self, '_alt_held', False) or event.alt
-                elif toggle_modifier == 'SHIFT':
-                    modifier_held = getattr(self, '_shift_held', False) or event.shift
-
+                # If the configured modifier is held (checked above), remove last token and
+                # keep modal open
                 if not modifier_held:
                     # Normal behavior: finish modal after toggle
                     self._finish(context)
                 else:
-                    # Modifier held: remove the last token from buffer and keep modal open
+                    # Modifier held: drop the last token from the buffer and keep modal open
                     # This puts us back to the state before the last key was pressed
-                    if self._buffer:
-                        self._buffer.pop()
+                    self._buffer = chord_tokens[:-1]
                     self._scroll_offset = 0
                     self._tag_redraw()
 
@@ -1153,15 +1239,12 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                     try:
                         # Define helpers for context execution
                         def do_toggle_path(path):
-                            parts = path.split('.')
-                            obj = bpy.context
-                            for part in parts[:-1]:
-                                next_obj = getattr(obj, part, None)
-                                if next_obj is None:
-                                    return None
-                                obj = next_obj
-                            prop_name = parts[-1]
-                            if not hasattr(obj, prop_name):
+                            get_owner, prop_name = _context_path_accessor(path)
+                            try:
+                                obj = get_owner(bpy.context)
+                            except AttributeError:
+                                return None
+                            if obj is None or not hasattr(obj, prop_name):
                                 return None
                             current_value = getattr(obj, prop_name)
                             if not isinstance(current_value, bool):
@@ -1171,26 +1254,19 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                             return set_val
 
                         def do_set_path(path, value):
-                            parts = path.split('.')
-                            obj = bpy.context
-                            for part in parts[:-1]:
-                                next_obj = getattr(obj, part, None)
-                                if next_obj is None:
-                                    return None
-                                obj = next_obj
-                            prop_name = parts[-1]
-                            if not hasattr(obj, prop_name):
+                            get_owner, prop_name = _context_path_accessor(path)
+                            try:
+                                obj = get_owner(bpy.context)
+                            except AttributeError:
+                                return None
+                            if obj is None or not hasattr(obj, prop_name):
                                 return None
                             setattr(obj, prop_name, value)
                             return value
 
                         # Collect all paths
-                        paths = []
-                        if context_path:
-                            paths.append(context_path)
-                        for item in m.sub_items:
-                            if item.path.strip():
-                                paths.append(item.path.strip())
+                        paths = [context_path] if context_path else []
+                        paths += [path for item in m.sub_items if (path := item.path.strip())]
 
                         # Execute state logic
                         sync = getattr(m, "sync_toggles", False)
@@ -1213,7 +1289,6 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                                         results.append(res)
 
                         # Validate context before using it (may be invalid after undo)
-                        from ..utils.render import validate_viewport_context
                         valid_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
 
                         # Execute with context override if available
@@ -1241,33 +1316,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                                 status_str = f"{on_count} ON, {off_count} OFF"
                                 overlay_label = f"{label} ({status_str})"
 
-                            # Use the original captured viewport context (ctx_viewport) for overlay
-                            overlay_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
-                            if overlay_ctx and overlay_ctx.get("area") and overlay_ctx.get("region"):
-                                try:
-                                    # Get space_data directly from the area (area.spaces[0] is the active space)
-                                    area = overlay_ctx["area"]
-                                    region = overlay_ctx["region"]
-                                    space_data = None
-                                    try:
-                                        if area.spaces:
-                                            space_data = area.spaces[0]
-                                    except Exception:
-                                        pass
-
-                                    # Create a context-like object with the area from overlay_ctx
-                                    class ContextWrapper:
-                                        def __init__(self, area, region, space_data):
-                                            self.area = area
-                                            self.region = region
-                                            self.space_data = space_data
-
-                                    wrapped_ctx = ContextWrapper(area, region, space_data)
-                                    _show_fading_overlay(wrapped_ctx, chord_tokens, overlay_label, icon)
-                                except (TypeError, RuntimeError, AttributeError, ReferenceError):
-                                    _show_fading_overlay(bpy.context, chord_tokens, overlay_label, icon)
-                            else:
-                                _show_fading_overlay(bpy.context, chord_tokens, overlay_label, icon)
+                            # Only properties were set since the context was validated, so reuse it
+                            overlay_ctx = valid_ctx
+                            _show_fading_overlay_in(overlay_ctx, chord_tokens, overlay_label, icon)
 
                         # Add to history
                         add_to_history(
@@ -1280,7 +1331,6 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         )
 
                         # Clear overlay cache so toggle state is re-evaluated on next redraw
-                        from ..ui.overlay.cache import clear_overlay_cache
                         clear_overlay_cache()
                         # Force redraw to update toggle icon immediately
                         # In toggle multi-execution mode, ensure overlay refreshes with all toggle mappings
@@ -1292,7 +1342,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         traceback.print_exc()
                     return None
 
-                bpy.app.timers.register(execute_toggle_delayed, first_interval=0.01)
+                bpy.app.timers.register(execute_toggle_delayed, first_interval=_DISPATCH_DELAY_S)
 
                 # If modifier is held, keep modal running; otherwise finish
                 if modifier_held:
@@ -1305,7 +1355,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                 context_path = (getattr(m, "context_path", "") or "").strip()
                 property_value = (getattr(m, "property_value", "") or "").strip()
                 if not context_path:
-                    self.report({"ERROR"}, f'Property mapping "{" ".join(self._buffer)}" has no context path. Please fix in preferences.')
+                    self.report({"ERROR"}, f'Property mapping "{" ".join(chord_tokens)}" has no context path. Please fix in preferences.')
                     self._finish(context)
                     return {"CANCELLED"}
 
@@ -1316,7 +1366,6 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
 
                 def execute_property_delayed():
                     try:
-                        import ast
                         # Helper to execute a single set
                         def do_set_item(path, val_str):
                             if not path or not val_str:
@@ -1327,36 +1376,25 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                             except (ValueError, SyntaxError):
                                 val_to_set = val_str
 
-                            parts = path.split('.')
-                            obj = bpy.context
-
                             # Navigate to the parent object
-                            for _, part in enumerate(parts[:-1]):
-                                next_obj = getattr(obj, part, None)
-                                if next_obj is None:
-                                    return False
-                                obj = next_obj
-
-                            # Get the property name
-                            prop_name = parts[-1]
+                            get_owner, prop_name = _context_path_accessor(path)
+                            try:
+                                obj = get_owner(bpy.context)
+                            except AttributeError:
+                                return False
 
                             # Set the value
-                            if not hasattr(obj, prop_name):
+                            if obj is None or not hasattr(obj, prop_name):
                                 return False
 
                             setattr(obj, prop_name, val_to_set)
                             return True
 
                         # Collect all pairs
-                        items = []
-                        if context_path:
-                            items.append((context_path, property_value))
-                        for sub in m.sub_items:
-                            if sub.path.strip():
-                                items.append((sub.path.strip(), sub.value))
+                        items = [(context_path, property_value)] if context_path else []
+                        items += [(path, sub.value) for sub in m.sub_items if (path := sub.path.strip())]
 
                         # Validate context before using it (may be invalid after undo)
-                        from ..utils.render import validate_viewport_context
                         valid_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
 
                         success_count = 0
@@ -1385,33 +1423,9 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                             else:
                                 overlay_label = f"{label}: {success_count} values set"
 
-                            # Use the original captured viewport context (ctx_viewport) for overlay
-                            overlay_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
-                            if overlay_ctx and overlay_ctx.get("area") and overlay_ctx.get("region"):
-                                try:
-                                    # Get space_data directly from the area (area.spaces[0] is the active space)
-                                    area = overlay_ctx["area"]
-                                    region = overlay_ctx["region"]
-                                    space_data = None
-                                    try:
-                                        if area.spaces:
-                                            space_data = area.spaces[0]
-                                    except Exception:
-                                        pass
-
-                                    # Create a context-like object with the area from overlay_ctx
-                                    class ContextWrapper:
-                                        def __init__(self, area, region, space_data):
-                                            self.area = area
-                                            self.region = region
-                                            self.space_data = space_data
-
-                                    wrapped_ctx = ContextWrapper(area, region, space_data)
-                                    _show_fading_overlay(wrapped_ctx, chord_tokens, overlay_label, icon)
-                                except (TypeError, RuntimeError, AttributeError, ReferenceError):
-                                    _show_fading_overlay(bpy.context, chord_tokens, overlay_label, icon)
-                            else:
-                                _show_fading_overlay(bpy.context, chord_tokens, overlay_label, icon)
+                            # Only properties were set since the context was validated, so reuse it
+                            overlay_ctx = valid_ctx
+                            _show_fading_overlay_in(overlay_ctx, chord_tokens, overlay_label, icon)
 
                         # Add to history
                         add_to_history(
@@ -1430,31 +1444,23 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         traceback.print_exc()
                     return None
 
-                bpy.app.timers.register(execute_property_delayed, first_interval=0.01)
+                bpy.app.timers.register(execute_property_delayed, first_interval=_DISPATCH_DELAY_S)
                 return {"FINISHED"}
 
             # Handle operator execution
-            operators_to_run = []
-
-            primary_op = (m.operator or "").strip()
-            if primary_op:
-                operators_to_run.append({
-                    "op": primary_op,
-                    "kwargs": parse_kwargs(getattr(m, "kwargs_json", "{}")),
-                    "call_ctx": (getattr(m, "call_context", "EXEC_DEFAULT") or "EXEC_DEFAULT").strip(),
-                })
-
-            for sub in m.sub_operators:
-                sub_op = (sub.operator or "").strip()
-                if sub_op:
-                    operators_to_run.append({
-                        "op": sub_op,
-                        "kwargs": parse_kwargs(getattr(sub, "kwargs_json", "{}")),
-                        "call_ctx": (getattr(sub, "call_context", "EXEC_DEFAULT") or "EXEC_DEFAULT").strip(),
-                    })
+            # The primary operator first, then the sub-operators, skipping empty ones
+            operators_to_run = [
+                {
+                    "op": sub_op,
+                    "kwargs": parse_kwargs(getattr(sub, "kwargs_json", "{}")),
+                    "call_ctx": (getattr(sub, "call_context", "EXEC_DEFAULT") or "EXEC_DEFAULT").strip(),
+                }
+                for sub in (m, *m.sub_operators)
+                if (sub_op := (sub.operator or "").strip())
+            ]
 
             if not operators_to_run:
-                self.report({"WARNING"}, f'Chord "{" ".join(self._buffer)}" has no operator')
+                self.report({"WARNING"}, f'Chord "{" ".join(chord_tokens)}" has no operator')
                 self._finish(context)
                 return {"CANCELLED"}
 
@@ -1470,7 +1476,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             if not should_restore_panels and self._panel_states:
                 # Transfer panel state to Scripts overlay by storing it globally
                 # Scripts overlay will restore panels when it finishes
-                _panel_states_global = self._panel_states.copy()
+                _panel_states_global = self._panel_states
                 # Clear our state so _finish doesn't restore
                 self._panel_states = {}
 
@@ -1482,7 +1488,6 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
             # Defer operator execution to next frame using a timer.
             def execute_operator_delayed():
                 try:
-                    from ..utils.render import validate_viewport_context
                     valid_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
 
                     success = False
@@ -1492,9 +1497,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         kwargs = op_data["kwargs"]
                         call_ctx = op_data["call_ctx"]
 
-                        mod_name, fn_name = op.split(".", 1)
-                        opmod = getattr(bpy.ops, mod_name)
-                        opfn = getattr(opmod, fn_name)
+                        opfn = resolve_operator(op)
 
                         result_set = set()
                         # Pass True as second arg to force undo registration,
@@ -1527,29 +1530,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                         primary_operator = operators_to_run[0]["op"] if operators_to_run else None
                         if primary_operator not in _meta_ops:
                             overlay_ctx = validate_viewport_context(ctx_viewport) if ctx_viewport else None
-                            if overlay_ctx and overlay_ctx.get("area") and overlay_ctx.get("region"):
-                                try:
-                                    area = overlay_ctx["area"]
-                                    region = overlay_ctx["region"]
-                                    space_data = None
-                                    try:
-                                        if area.spaces:
-                                            space_data = area.spaces[0]
-                                    except Exception:
-                                        pass
-
-                                    class ContextWrapper:
-                                        def __init__(self, area, region, space_data):
-                                            self.area = area
-                                            self.region = region
-                                            self.space_data = space_data
-
-                                    wrapped_ctx = ContextWrapper(area, region, space_data)
-                                    _show_fading_overlay(wrapped_ctx, chord_tokens, label, icon)
-                                except (TypeError, RuntimeError, AttributeError, ReferenceError):
-                                    _show_fading_overlay(bpy.context, chord_tokens, label, icon)
-                            else:
-                                _show_fading_overlay(bpy.context, chord_tokens, label, icon)
+                            _show_fading_overlay_in(overlay_ctx, chord_tokens, label, icon)
 
                             add_to_history(
                                 chord_tokens=chord_tokens,
@@ -1566,12 +1547,11 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                     traceback.print_exc()
                 return None
 
-            bpy.app.timers.register(execute_operator_delayed, first_interval=0.01)
+            bpy.app.timers.register(execute_operator_delayed, first_interval=_DISPATCH_DELAY_S)
             return {"FINISHED"}
 
-        # Still a prefix?
-        cands = candidates_for_prefix(filtered_mappings, self._buffer, context=context)
-        if cands:
+        # Still a prefix? (the overlay builds the actual candidates when it draws)
+        if has_candidates_in_trie(_get_chord_trie(p, self._context_type, filtered_mappings), self._buffer):
             self._tag_redraw()
             return {"RUNNING_MODAL"}
 
@@ -1586,7 +1566,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                     return {"CANCELLED"}
                 if meta_op == "chordsong.recents":
                     if self._panel_states:
-                        _panel_states_global = self._panel_states.copy()
+                        _panel_states_global = self._panel_states
                         self._panel_states = {}
                     self._finish(context, restore_panels=False)
                     try:
@@ -1595,7 +1575,7 @@ class CHORDSONG_OT_Leader(bpy.types.Operator):
                     except Exception as e:
                         print(f"Chord Song: Failed to open recents: {e}")
                         if _panel_states_global:
-                            self._panel_states = _panel_states_global.copy()
+                            self._panel_states = _panel_states_global
                             self._restore_panels(context)
                             _panel_states_global = {}
                     return {"FINISHED"}
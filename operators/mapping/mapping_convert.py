@@ -159,7 +159,7 @@ class CHORDSONG_OT_Mapping_Convert(bpy.types.Operator):
                 # 1. There is no existing chord, OR
                 # 2. The existing chord conflicts with another mapping (exact or prefix)
                 try:
-                    from ..context_menu.suggester import suggest_chord, has_prefix_conflict
+                    from ..context_menu.suggester import suggest_chord, has_prefix_conflict_in
                     # Determine group
                     group = m.group
                     if not group and "." in operator_name:
@@ -179,7 +179,7 @@ class CHORDSONG_OT_Mapping_Convert(bpy.types.Operator):
                             if other_m != m and other_m.enabled and other_m.chord.strip():
                                 other_chords.add(other_m.chord.strip().lower())
                         
-                        if has_prefix_conflict(current_chord, other_chords):
+                        if has_prefix_conflict_in(current_chord, other_chords):
                             should_suggest = True
                     
                     if should_suggest:
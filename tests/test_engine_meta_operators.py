@@ -10,7 +10,13 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from core.engine import candidates_for_prefix, find_exact_mapping
+from core.engine import (
+    build_chord_trie,
+    candidates_for_prefix,
+    find_exact_mapping,
+    find_exact_mapping_in_trie,
+    has_candidates_in_trie,
+)
 
 
 class FakeMapping:
@@ -76,10 +82,36 @@ def test_disabled_meta_operator_not_matched():
     assert m is None, "disabled mapping should not be found"
 
 
+def test_trie_lookup_matches_find_exact_mapping():
+    mappings = [
+        FakeMapping("q", operator="chordsong.close_overlay", enabled=False),
+        FakeMapping("q", operator="chordsong.close_overlay"),
+        FakeMapping("^a", operator="chordsong.recents"),
+        FakeMapping("<^a", operator="mesh.primitive_cube_add"),
+    ]
+    trie = build_chord_trie(mappings)
+    for buffer in (["q"], ["^a"], ["<^a"], [">^a"], ["a"]):
+        assert find_exact_mapping_in_trie(trie, buffer) is find_exact_mapping(mappings, buffer), buffer
+
+
+def test_trie_prefix_check_skips_meta_operators():
+    mappings = [
+        FakeMapping("g r", operator="chordsong.recents"),
+        FakeMapping("g q", operator="chordsong.close_overlay"),
+        FakeMapping("h a", operator="mesh.primitive_cube_add"),
+    ]
+    trie = build_chord_trie(mappings)
+    for buffer in (["g"], ["h"], ["h", "a"]):
+        expected = bool(candidates_for_prefix(mappings, buffer))
+        assert has_candidates_in_trie(trie, buffer) == expected, buffer
+
+
 if __name__ == "__main__":
     test_candidates_skips_close_overlay()
     test_candidates_skips_recents()
     test_find_exact_mapping_finds_close_overlay()
     test_find_exact_mapping_finds_recents()
     test_disabled_meta_operator_not_matched()
+    test_trie_lookup_matches_find_exact_mapping()
+    test_trie_prefix_check_skips_meta_operators()
     print("All meta-operator tests passed.")
@@ -290,10 +290,15 @@ def draw_mappings_tab(prefs, context, layout):
 
     # Build group order from prefs.groups collection (user-defined order)
     # Groups in the collection come first (in order), then any remaining groups alphabetically
+    # Read each group name once; headers below look groups up here instead of rescanning
+    group_lookup = {}
     group_order = []
-    for grp in prefs.groups:
-        if grp.name in groups:
-            group_order.append(grp.name)
+    for grp_idx, grp in enumerate(prefs.groups):
+        grp_name = grp.name
+        if grp_name not in group_lookup:
+            group_lookup[grp_name] = (grp_idx, grp)
+        if grp_name in groups:
+            group_order.append(grp_name)
     # Add any groups not in the collection (e.g., "Ungrouped" or orphaned groups)
     remaining = [g for g in groups.keys() if g not in group_order]
     # Sort remaining: "Ungrouped" first, then alphabetically
@@ -306,7 +311,8 @@ def draw_mappings_tab(prefs, context, layout):
         # Keep items in the order they appear in prefs.mappings (manual ordering)
         # Don't sort automatically - users can use the sort button if they want alphabetical order
 
-        is_expanded, expand_data, expand_prop = _get_group_expansion_state(prefs, group_name)
+        group_entry = group_lookup.get(group_name) if group_name != "Ungrouped" else None
+        is_expanded, expand_data, expand_prop = _get_group_expansion_state(prefs, group_name, group_entry)
 
         # Auto-expand groups when search is active
         if search_query:
@@ -334,12 +340,7 @@ def draw_mappings_tab(prefs, context, layout):
             )
 
         # Show group icon if available
-        group_icon = ""
-        if group_name != "Ungrouped":
-            for grp in prefs.groups:
-                if grp.name == group_name:
-                    group_icon = grp.icon
-                    break
+        group_icon = group_entry[1].icon if group_entry else ""
 
         # Show conflict indicator if group has conflicted chords
         if group_has_conflicts:
@@ -371,8 +372,8 @@ def draw_mappings_tab(prefs, context, layout):
 
         # Rename, Move, and Delete group buttons
         if group_name != "Ungrouped":
-            group_idx = _get_group_index(prefs, group_name)
-            if group_idx is not None:
+            if group_entry is not None:
+                group_idx = group_entry[0]
                 # Move up button
                 op = row_right.operator("chordsong.group_move_up", text="", icon="TRIA_UP", emboss=False)
                 op.index = group_idx
@@ -400,20 +401,13 @@ def draw_mappings_tab(prefs, context, layout):
 
     col.separator()
 
-def _get_group_expansion_state(prefs, group_name):
-    """Retrieve expansion state for a group."""
+def _get_group_expansion_state(prefs, group_name, group_entry):
+    """Retrieve expansion state for a group from its (index, group) lookup entry."""
     if group_name == "Ungrouped":
         return prefs.ungrouped_expanded, prefs, "ungrouped_expanded"
 
-    for grp in prefs.groups:
-        if grp.name == group_name:
-            return grp.expanded, grp, "expanded"
+    if group_entry is not None:
+        grp = group_entry[1]
+        return grp.expanded, grp, "expanded"
 
     return True, None, None
-
-def _get_group_index(prefs, group_name):
-    """Retrieve group index by name."""
-    for idx, grp in enumerate(prefs.groups):
-        if grp.name == group_name:
-            return idx
-    return None
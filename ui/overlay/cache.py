@@ -8,13 +8,22 @@ _overlay_cache = {
     "filepath": None,
 }
 
+# Bumped on every cache clear so mapping-derived caches elsewhere can revalidate
+_mappings_revision = 0
+
 def clear_overlay_cache():
     """Clear the overlay cache. Call when mappings are updated."""
+    global _mappings_revision
+    _mappings_revision += 1
     _overlay_cache["buffer_tokens"] = None
     _overlay_cache["prefs_hash"] = None
     _overlay_cache["layout_data"] = None
     _overlay_cache["filepath"] = None
 
+def get_mappings_revision():
+    """Get a counter that changes whenever mappings are reported as updated."""
+    return _mappings_revision
+
 def get_prefs_hash(p, region_w, region_h):
     """Get a hash of preferences that affect overlay layout."""
     return (
@@ -952,7 +952,8 @@ def draw_overlay(context, p, buffer_tokens, filtered_mappings=None, custom_heade
         layout.get("scripts_overlay_settings"),
     )
 
-def draw_fading_overlay(context, p, chord_text, label, icon, start_time, fade_duration=1.5, show_chord=True):
+def draw_fading_overlay(context, p, chord_text, label, icon, start_time, fade_duration=1.5, show_chord=True,
+                        region_width=None, region_height=None):
     """Draw a fading overlay showing the executed chord.
     
     Args:
@@ -964,6 +965,8 @@ def draw_fading_overlay(context, p, chord_text, label, icon, start_time, fade_du
         start_time: Start time for fade calculation
         fade_duration: Duration of fade in seconds
         show_chord: Whether to display the chord text (default True)
+        region_width: Width of the target region (default: context.region.width)
+        region_height: Height of the target region (default: context.region.height)
     """
     # Check if fading overlay is enabled
     if not getattr(p, "overlay_fading_enabled", True):
@@ -983,13 +986,17 @@ def draw_fading_overlay(context, p, chord_text, label, icon, start_time, fade_du
     fade_alpha = max(0.0, 1.0 - (elapsed / fade_duration))
 
     # Basic metrics - handle cases where region might be None or invalid
-    try:
-        region_w = context.region.width if context.region else 600
-        region_h = context.region.height if context.region else 400
-    except (AttributeError, ReferenceError, RuntimeError):
-        # Region is invalid or has been destroyed
-        region_w = 600
-        region_h = 400
+    if region_width is not None and region_height is not None:
+        region_w = region_width
+        region_h = region_height
+    else:
+        try:
+            region_w = context.region.width if context.region else 600
+            region_h = context.region.height if context.region else 400
+        except (AttributeError, ReferenceError, RuntimeError):
+            # Region is invalid or has been destroyed
+            region_w = 600
+            region_h = 400
 
     scale_factor = calculate_scale_factor(context)
 
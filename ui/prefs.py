@@ -148,6 +148,19 @@ def _on_group_changed(_self, context):
     except Exception:
         pass
 
+def _on_group_identity_changed(self, context):
+    # Group names and icons feed the overlay and name-keyed caches, so drop those
+    # before the usual autosave. UI-only state like expanded doesn't come here.
+    try:
+        if _SUSPEND_CALLBACKS:
+            return
+
+        from .overlay import clear_overlay_cache
+        clear_overlay_cache()
+    except Exception:
+        pass
+    _on_group_changed(self, context)
+
 def _group_search_callback(_self, context, _edit_text):
     try:
         pkg = _addon_root_pkg()
@@ -290,13 +303,13 @@ class CHORDSONG_PG_Group(PropertyGroup):
         name="Group Name",
         description="Name of the group",
         default="",
-        update=_on_group_changed,
+        update=_on_group_identity_changed,
     )
     icon: StringProperty(
         name="Icon",
         description="Nerd Fonts emoji/icon for this group (e.g. '', '', '', '')",
         default="",
-        update=_on_group_changed,
+        update=_on_group_identity_changed,
     )
     display_order: IntProperty(
         name="Display Order",
@@ -1076,7 +1089,8 @@ class CHORDSONG_Preferences(AddonPreferences):
         if self.nerd_icons:
             return  # Already populated
 
-        for name, icon_char in NERD_ICONS:
+        # Store sorted by name so the icon picker's sort has no work to do
+        for name, icon_char in sorted(NERD_ICONS, key=lambda item: item[0].lower()):
             icon_item = self.nerd_icons.add()
             icon_item.name = name
             icon_item.icon = icon_char
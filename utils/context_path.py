@@ -1,11 +1,16 @@
 """Path normalization utilities for property and context paths."""
 import re
 
+# Precompiled patterns used by normalize_bpy_data_path
+_BPY_PREFIX_RE = re.compile(r'^bpy\.(?:context|data)\.')
+_SCREEN_SPACE_RE = re.compile(r'^screens\[[^\]]+\]\.areas\[\d+\]\.spaces\[\d+\]\.(.+)$')
+_INDEXED_COLLECTION_RE = re.compile(r'^(\w+)\[[^\]]+\]\.(.+)$')
+
 def normalize_bpy_data_path(path):
     """Normalize bpy.data paths to context-relative paths.
 
     Converts patterns like scenes["Scene"] -> scene, worlds["World"] -> world, etc.
-    Removes bpy.data. prefix and indexed collection access, converting plural to singular.
+    Removes bpy.data. / bpy.context. prefix and indexed collection access, converting plural to singular.
     Special handling for screens[...].areas[...].spaces[...] -> space_data
 
     Args:
@@ -24,15 +29,12 @@ def normalize_bpy_data_path(path):
         >>> normalize_bpy_data_path('bpy.data.screens["Modeling"].areas[1].spaces[0].overlay.show_face_orientation')
         'space_data.overlay.show_face_orientation'
     """
-    cleaned_path = path
-
-    # Remove bpy.data. prefix if present
-    if cleaned_path.startswith("bpy.data."):
-        cleaned_path = cleaned_path[len("bpy.data."):]
+    # Remove bpy.data. / bpy.context. prefix if present
+    cleaned_path = _BPY_PREFIX_RE.sub('', path, count=1)
 
     # Special case: screens[...].areas[...].spaces[...] -> space_data
     # Pattern: screens["name"].areas[N].spaces[M].rest_of_path -> space_data.rest_of_path
-    screens_match = re.match(r'^screens\[[^\]]+\]\.areas\[\d+\]\.spaces\[\d+\]\.(.+)$', cleaned_path)
+    screens_match = _SCREEN_SPACE_RE.match(cleaned_path)
     if screens_match:
         rest_of_path = screens_match.group(1)
         return f'space_data.{rest_of_path}'
@@ -40,7 +42,7 @@ def normalize_bpy_data_path(path):
     # Remove indexed collection access and convert to singular
     # Pattern: collection_name["index"].rest_of_path -> singular.rest_of_path
     # This works whether or not the path had bpy.data. prefix
-    match = re.match(r'^(\w+)\[[^\]]+\]\.(.+)$', cleaned_path)
+    match = _INDEXED_COLLECTION_RE.match(cleaned_path)
     if match:
         collection_name = match.group(1)
         rest_of_path = match.group(2)
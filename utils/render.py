@@ -263,6 +263,18 @@ class DrawHandlerManager:
     def region(self):
         return self._region
 
+# bpy.ops callables by operator id ("module.name"); bpy.ops resolves the RNA operator per call
+_op_resolve_cache = {}
+
+def resolve_operator(op_id):
+    """Get the bpy.ops callable for an operator id like "mesh.primitive_cube_add"."""
+    opfn = _op_resolve_cache.get(op_id)
+    if opfn is None:
+        mod_name, fn_name = op_id.split(".", 1)
+        opfn = getattr(getattr(bpy.ops, mod_name), fn_name)
+        _op_resolve_cache[op_id] = opfn
+    return opfn
+
 def _run_single_operator(opfn, call_ctx, kwargs, valid_ctx):
     """Run a single operator with the given context and undo=True."""
     if call_ctx == "INVOKE_DEFAULT":
@@ -303,9 +315,7 @@ def execute_history_entry_operator(context, entry):
 
         success = False
         for op_data in entry.operators:
-            op_id = op_data["op"]
-            mod_name, fn_name = op_id.split(".", 1)
-            opfn = getattr(getattr(bpy.ops, mod_name), fn_name)
+            opfn = resolve_operator(op_data["op"])
             result_set = _run_single_operator(
                 opfn, op_data["call_ctx"], op_data["kwargs"], valid_ctx
             )
@@ -370,16 +380,14 @@ def _execute_script_via_text_editor(filepath, script_args=None, valid_ctx=None,
         text_block = bpy.data.texts.new(temp_name)
         text_block.write(full_script)
         
-        # Prepare context override
-        override = bpy.context.copy()
-        override["edit_text"] = text_block
+        # Prepare context override; temp_override keeps every member it is not given,
+        # so only the members that differ from the current context are passed
+        override = {"edit_text": text_block}
         
         # Execute the script
         if valid_ctx:
             try:
-                override.update(valid_ctx)
-                override["edit_text"] = text_block
-                with bpy.context.temp_override(**override):
+                with bpy.context.temp_override(**valid_ctx, **override):
                     bpy.ops.text.run_script()
             except (TypeError, RuntimeError, AttributeError, ReferenceError):
                 # Context became invalid, fall back to default context